@@ -6,18 +6,37 @@ import base64
 import dateparser
 import unicodedata
 import logging
-import json
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+import orjson
+import atexit
+import hashlib
+import secrets
+import uuid
+import functools
+import threading
+import jinja2
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.utils import getaddresses
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+import google_auth_httplib2
+import httplib2
 import google.generativeai as genai
+import redis
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g, has_request_context, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_session import Session
 
 # Import existing calendar functions
@@ -35,6 +54,27 @@ from calenderinternal import (
 # Load environment variables
 load_dotenv()
 
+# Request-flow diagnostics; debug records are formatted only when enabled
+logger = logging.getLogger(__name__)
+update_logger = logging.getLogger('calendar_updates')
+
+def configure_logging():
+    """Send log records through a listener thread unless the server already configured logging"""
+    if logging.getLogger().handlers:
+        return
+    # LOG_LEVEL=WARNING silences per-request info logs in production.
+    # Records are handed to a listener thread so request threads never block on stderr.
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+configure_logging()
+
 # Initialize Gemini with retry mechanism and error handling
 def initialize_gemini():
     try:
@@ -51,15 +91,111 @@ def initialize_gemini():
 
 model = initialize_gemini()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider for jsonify and request.json backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode()
+    
+    def dumps_bytes(self, obj):
+        # Flask's own fallback still handles dates, UUIDs and dataclasses
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=orjson.OPT_NON_STR_KEYS)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding and re-encoding them
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
 # Flask App Configuration
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "your-secret-key-here")
-app.config["SESSION_TYPE"] = "filesystem"
+# Redis connections shared by request threads; extra requests wait instead of reconnecting
+REDIS_MAX_CONNECTIONS = 50
+# Idle sessions (and their Redis data) expire after this long
+app.config["PERMANENT_SESSION_LIFETIME"] = timedelta(hours=10)
+# Keep sessions in Redis when available; filesystem pickling is the local fallback
+if os.getenv("REDIS_URL"):
+    app.config["SESSION_TYPE"] = "redis"
+    app.config["SESSION_REDIS"] = redis.Redis(
+        connection_pool=redis.BlockingConnectionPool.from_url(
+            os.getenv("REDIS_URL"),
+            max_connections=REDIS_MAX_CONNECTIONS,
+            socket_keepalive=True
+        )
+    )
+else:
+    app.config["SESSION_TYPE"] = "filesystem"
+app.config["SESSION_USE_SIGNER"] = True
 Session(app)
 
+# Socket timeout (seconds) for Gmail/Calendar HTTP connections
+GOOGLE_HTTP_TIMEOUT = 30
+
+# Retries (with exponential backoff) for read-only Google API calls on 429/5xx or dropped connections
+GOOGLE_API_READ_RETRIES = 3
+
+# httplib2.Http is not thread-safe, so each worker thread keeps its own keep-alive pool
+google_http_local = threading.local()
+
+def get_thread_http(credentials):
+    """Get this thread's persistent authorized HTTP connection for the credentials"""
+    pool = getattr(google_http_local, 'pool', None)
+    if pool is None:
+        pool = google_http_local.pool = {}
+    authorized_http = pool.get(id(credentials))
+    if authorized_http is None:
+        authorized_http = google_auth_httplib2.AuthorizedHttp(
+            credentials,
+            http=httplib2.Http(timeout=GOOGLE_HTTP_TIMEOUT)
+        )
+        pool[id(credentials)] = authorized_http
+    return authorized_http
+
+class RetryingHttpRequest(HttpRequest):
+    """API request that retries GETs by default; writes are not retried to avoid duplicates"""
+    
+    def execute(self, http=None, num_retries=None):
+        if num_retries is None:
+            num_retries = GOOGLE_API_READ_RETRIES if self.method == 'GET' else 0
+        return super().execute(http=http, num_retries=num_retries)
+
+def build_google_service(api_name, api_version, credentials):
+    """Build an API client whose requests reuse the calling thread's connection"""
+    def build_request(http, *args, **kwargs):
+        return RetryingHttpRequest(get_thread_http(credentials), *args, **kwargs)
+    
+    return build(
+        api_name,
+        api_version,
+        http=get_thread_http(credentials),
+        requestBuilder=build_request,
+        cache_discovery=False
+    )
+
+def use_persistent_connections(services):
+    """Rebuild authenticated services on shared per-thread keep-alive connections"""
+    if not isinstance(services, dict):
+        return services
+    
+    api_versions = {'gmail': 'v1', 'calendar': 'v3'}
+    for name, version in api_versions.items():
+        service = services.get(name)
+        credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+        if credentials is None:
+            continue
+        try:
+            services[name] = build_google_service(name, version, credentials)
+        except Exception as e:
+            print(f"⚠️ Keeping default transport for {name}: {e}")
+    return services
+
 # Initialize services
 try:
-    services = authenticate_services()
+    services = use_persistent_connections(authenticate_services())
     print("✅ Services authenticated successfully")
 except Exception as e:
     print(f"❌ Error authenticating services: {e}")
@@ -78,6 +214,32 @@ EMAIL_CONFIG = {
     'cache_duration': 600      # 10 minutes cache duration
 }
 
+# Gmail accepts at most 100 calls in a single batch request
+GMAIL_BATCH_LIMIT = 100
+# Calendar accepts at most 50 calls in a single batch request
+CALENDAR_BATCH_LIMIT = 50
+# Most meetings one bulk cancellation may delete, i.e. one Calendar batch request
+BULK_CANCEL_MAX_MEETINGS = CALENDAR_BATCH_LIMIT
+
+# Email body bytes decoded; prompts and keyword scans only read the start
+EMAIL_BODY_MAX_BYTES = 8192
+
+# Concurrent Gemini requests when processing a batch of emails
+AI_MAX_WORKERS = 16
+
+# Background threads sending notification emails (e.g. conflict notices) after the response
+NOTIFICATION_MAX_WORKERS = 8
+
+# Meeting-request emails processed concurrently (AI extraction + Calendar calls)
+MEETING_REQUEST_MAX_WORKERS = 8
+
+# Emails categorized per Gemini request
+AI_CATEGORIZE_BATCH_SIZE = 10
+
+# Persistent cache of Gemini results keyed on email content
+AI_CACHE_FILE = os.getenv("AI_CACHE_FILE", "ai_cache.json")
+AI_CACHE_MAX_ENTRIES = 4096
+
 # ===== ENHANCED CALENDAR FUNCTIONS =====
 def create_event_with_meeting_link(calendar_service, summary, start_time, end_time, participant_email):
     """Create calendar event with Google Meet link and send invitation"""
@@ -88,6 +250,11 @@ def create_event_with_meeting_link(calendar_service, summary, start_time, end_ti
         if not isinstance(end_time, str):
             end_time = end_time.isoformat()
         
+        # Unique per scheduling attempt, since Calendar ignores a requestId it has seen before
+        # (a cancelled-then-rescheduled meeting would get no Meet link). The body is built once,
+        # so any retry of this insert reuses the same id.
+        conference_request_id = f"meet-{uuid.uuid4().hex}"
+        
         event = {
             'summary': summary,
             'start': {
@@ -104,7 +271,7 @@ def create_event_with_meeting_link(calendar_service, summary, start_time, end_ti
             ],
             'conferenceData': {
                 'createRequest': {
-                    'requestId': f"meet-{int(time.time())}-{hash(summary) % 10000}",
+                    'requestId': conference_request_id,
                     'conferenceSolutionKey': {'type': 'hangoutsMeet'}
                 }
             },
@@ -125,6 +292,7 @@ def create_event_with_meeting_link(calendar_service, summary, start_time, end_ti
             conferenceDataVersion=1,
             sendUpdates='all'
         ).execute()
+        invalidate_scheduled_meetings()
         
         print(f"✅ Event created: {created_event.get('htmlLink')}")
         
@@ -158,6 +326,7 @@ def update_event_with_meeting_link(calendar_service, event, new_start_time, new_
             conferenceDataVersion=1,
             sendUpdates='all'
         ).execute()
+        invalidate_scheduled_meetings()
         
         print(f"✅ Event updated successfully")
         return updated_event
@@ -167,60 +336,44 @@ def update_event_with_meeting_link(calendar_service, event, new_start_time, new_
         return None
 
 # ===== ENHANCED EMAIL FUNCTIONS =====
-def send_meeting_cancellation_email(gmail_service, participant_email, event_name, reason=""):
-    """Send meeting cancellation email"""
-    try:
-        subject = f"❌ Meeting Cancelled: {event_name}"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                <div style="background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); color: white; padding: 30px; border-radius: 10px; text-align: center;">
-                    <h1 style="margin: 0; font-size: 28px;">❌ Meeting Cancelled</h1>
-                    <p style="margin: 10px 0 0 0; font-size: 16px; opacity: 0.9;">We regret to inform you</p>
-                </div>
-                
-                <div style="background-color: #fef2f2; padding: 25px; border-radius: 8px; margin: 25px 0; border-left: 5px solid #dc2626;">
-                    <p style="color: #991b1b; font-size: 16px; margin: 0 0 15px 0;">
-                        We regret to inform you that the following meeting has been cancelled:
-                    </p>
-                    <h2 style="color: #dc2626; margin: 10px 0; font-size: 20px;">{event_name}</h2>
-                    {f'<div style="background-color: #fee2e2; padding: 15px; border-radius: 6px; margin: 15px 0;"><p style="margin: 0; color: #991b1b;"><strong>Reason:</strong> {reason}</p></div>' if reason else ""}
-                </div>
-                
-                <div style="margin-top: 40px; padding-top: 25px; border-top: 2px solid #e5e7eb; text-align: center;">
-                    <p style="color: #6b7280; font-size: 14px; margin: 0;">
-                        We apologize for any inconvenience this may cause.<br>
-                        Please contact us if you need to reschedule or have any questions.
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text_body = f"""
-❌ MEETING CANCELLED: {event_name}
-
-We regret to inform you that the following meeting has been cancelled:
-{event_name}
-
-{f'Reason: {reason}' if reason else ''}
-
-We apologize for any inconvenience this may cause.
-Please contact us if you need to reschedule or have any questions.
-        """
-        
-        return send_enhanced_email(gmail_service, participant_email, subject, text_body, html_body)
-        
-    except Exception as e:
-        print(f"❌ Error sending cancellation email: {e}")
-        return False
+# Custom email HTML body compiled once; rendered per send
+CUSTOM_EMAIL_HTML_TEMPLATE = jinja2.Template("""
+<html>
+<body>
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h2 style="color: #2563eb;">{{ subject }}</h2>
+        <div style="background-color: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
+            {{ message | replace('\\n', '<br>') }}
+        </div>
+        <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb;">
+            <p style="color: #6b7280; font-size: 14px;">
+                This message was sent by the AI Calendar Management System.
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+# Background workers that deliver attendee notifications after the response
+notification_executor = ThreadPoolExecutor(max_workers=NOTIFICATION_MAX_WORKERS, thread_name_prefix='notify')
+
+def queue_notification(description, send_function, *args):
+    """Send a notification in the background and log it if delivery fails"""
+    def report(future):
+        error = future.exception()
+        if error is not None:
+            print(f"❌ Background notification failed ({description}): {error}")
+        elif not future.result():
+            print(f"⚠️ Background notification not delivered ({description})")
+    
+    future = notification_executor.submit(send_function, *args)
+    future.add_done_callback(report)
+    return future
 
 # ===== ENHANCED EMAIL PROCESSING FUNCTIONS =====
 def fetch_recent_emails(gmail_service, max_results=EMAIL_CONFIG['default_batch_size']):
-    """Fetch recent emails from inbox with enhanced pagination"""
+    """Fetch recent emails from inbox using batched Gmail requests"""
     try:
         # Clamp max_results to prevent excessive API calls
         max_results = min(max_results, EMAIL_CONFIG['max_batch_size'])
@@ -233,33 +386,37 @@ def fetch_recent_emails(gmail_service, max_results=EMAIL_CONFIG['default_batch_s
         ).execute()
         
         messages = results.get('messages', [])
-        emails = []
+        fetched = {}
+        
+        def on_message(request_id, response, exception):
+            if exception is not None:
+                print(f"⚠️ Error fetching message {request_id}: {exception}")
+                return
+            email_data = parse_email_message(response)
+            if email_data:
+                fetched[request_id] = email_data
         
         print(f"📧 Fetching {len(messages)} emails...")
         
-        # Process messages in batches to avoid API rate limits
-        batch_size = 10
-        for i in range(0, len(messages), batch_size):
-            batch = messages[i:i+batch_size]
-            
-            for message in batch:
-                try:
-                    msg = gmail_service.users().messages().get(
-                        userId='me', 
-                        id=message['id']
-                    ).execute()
-                    
-                    email_data = parse_email_message(msg)
-                    if email_data:
-                        emails.append(email_data)
-                        
-                except Exception as e:
-                    print(f"⚠️ Error fetching message {message['id']}: {e}")
-                    continue
-            
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(messages):
-                time.sleep(0.1)
+        # One HTTP round trip per batch instead of one per message
+        for i in range(0, len(messages), GMAIL_BATCH_LIMIT):
+            batch = gmail_service.new_batch_http_request(callback=on_message)
+            for message in messages[i:i + GMAIL_BATCH_LIMIT]:
+                # Headers and snippet are enough for listing; bodies are loaded lazily
+                batch.add(
+                    gmail_service.users().messages().get(
+                        userId='me',
+                        id=message['id'],
+                        format='metadata',
+                        metadataHeaders=['Subject', 'From', 'Date'],
+                        fields='id,threadId,snippet,payload/headers'
+                    ),
+                    request_id=message['id']
+                )
+            batch.execute()
+        
+        # Keep the inbox ordering returned by messages().list()
+        emails = [fetched[message['id']] for message in messages if message['id'] in fetched]
         
         print(f"✅ Successfully fetched {len(emails)} emails")
         return emails
@@ -274,10 +431,11 @@ def parse_email_message(message):
         payload = message['payload']
         headers = payload.get('headers', [])
         
-        # Extract headers
-        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-        sender = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-        date = next((h['value'] for h in headers if h['name'] == 'Date'), '')
+        # Extract headers (names are case-insensitive per RFC 5322)
+        header_map = {h['name'].lower(): h['value'] for h in reversed(headers)}
+        subject = header_map.get('subject', 'No Subject')
+        sender = header_map.get('from', 'Unknown')
+        date = header_map.get('date', '')
         
         # Extract body
         body = extract_email_body(payload)
@@ -305,73 +463,268 @@ def parse_email_message(message):
             'timestamp': time.time()
         }
 
+def decode_body_data(data, max_bytes=EMAIL_BODY_MAX_BYTES):
+    """Decode base64url body data, skipping the tail that no caller reads"""
+    # Every 4 base64 characters carry 3 bytes
+    prefix_length = -(-max_bytes // 3) * 4
+    if len(data) > prefix_length:
+        decoded = base64.urlsafe_b64decode(data[:prefix_length])[:max_bytes]
+        # The cut may land inside a multi-byte character
+        return decoded.decode('utf-8', errors='ignore')
+    return base64.urlsafe_b64decode(data).decode('utf-8')
+
 def extract_email_body(payload):
     """Extract email body from message payload"""
     body = ""
     
     try:
         if 'parts' in payload:
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain' and part['body'].get('data'):
-                    data = part['body']['data']
-                    body = base64.urlsafe_b64decode(data).decode('utf-8')
+            # Walk nested multiparts depth-first, stopping at the first text/plain part
+            stack = list(reversed(payload['parts']))
+            while stack:
+                part = stack.pop()
+                if part.get('parts'):
+                    stack.extend(reversed(part['parts']))
+                elif part.get('mimeType') == 'text/plain' and part.get('body', {}).get('data'):
+                    body = decode_body_data(part['body']['data'])
                     break
-        elif payload['body'].get('data'):
-            data = payload['body']['data']
-            body = base64.urlsafe_b64decode(data).decode('utf-8')
+        elif payload.get('body', {}).get('data'):
+            body = decode_body_data(payload['body']['data'])
     except Exception as e:
         print(f"⚠️ Error extracting email body: {e}")
         body = ""
     
     return body
 
-def categorize_email_fallback(email):
-    """Fallback categorization when AI is unavailable"""
-    subject = email.get('subject', '').lower()
-    body = email.get('body', '').lower()
-    snippet = email.get('snippet', '').lower()
-    
-    # Combine text for analysis
-    text = f"{subject} {body} {snippet}".lower()
-    
+def fetch_email_body(gmail_service, message_id):
+    """Fetch only the body parts of a message for callers that need full content"""
+    try:
+        msg = gmail_service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='full',
+            fields='payload(body/data,parts(mimeType,body/data,parts(mimeType,body/data,parts(mimeType,body/data))))'
+        ).execute()
+        return extract_email_body(msg.get('payload', {}))
+    except Exception as e:
+        print(f"⚠️ Error fetching body for message {message_id}: {e}")
+        return ""
+
+# ===== AI PROMPT TEMPLATES =====
+SUMMARIZE_INSTRUCTIONS = """
+        Summarize this email in 1-2 concise sentences. Focus on key points and action items.
+        
+        Provide only the summary, no additional formatting.
+        """
+
+MEETING_EXTRACTION_INSTRUCTIONS = """
+        Extract meeting details from this email. Return ONLY valid JSON format.
+        
+        Extract and return exactly this JSON structure:
+        {
+            "participant_email": "sender email address or null",
+            "event_name": "meeting title or null", 
+            "event_date": "YYYY-MM-DD format or null",
+            "event_time": "time range like '10:00 AM to 11:00 AM' or null",
+            "has_complete_info": true|false
+        }
+        
+        Rules:
+        - Extract sender email from sender field
+        - Use future dates only
+        - Set has_complete_info to true only if ALL fields have valid values
+        """
+
+def build_ai_prompt(instructions, email_fields):
+    """Combine the static instructions with one request's email fields"""
+    return f"{instructions}\n{email_fields}"
+
+BATCH_CATEGORIZE_INSTRUCTIONS = """
+        Analyze each of the following numbered emails and categorize it. Respond ONLY with valid JSON format.
+        
+        Return a JSON array with exactly one object per email, in the same order, with no additional text.
+        Each object must have exactly this structure:
+        {
+            "urgency": "high|medium|low",
+            "category": "meeting|task|information|personal|spam",
+            "action_required": true|false,
+            "confidence": 0.8,
+            "reason": "brief explanation",
+            "is_meeting_request": true|false
+        }
+        """
+
+CATEGORY_REQUIRED_FIELDS = ["urgency", "category", "action_required", "confidence", "reason", "is_meeting_request"]
+
+# Per-email prompt tails, formatted with the email fields on each call
+EMAIL_FIELDS_TEMPLATE = """
+        Subject: {subject}
+        From: {sender}
+        Content: {content}
+        """
+
+MEETING_FIELDS_TEMPLATE = """
+        Subject: {subject}
+        From: {sender}
+        Body: {body}
+        """
+
+def get_response_text(response):
+    """Read the first candidate's text once; empty when the response was blocked or empty"""
+    try:
+        return response.candidates[0].content.parts[0].text
+    except (AttributeError, IndexError, TypeError):
+        return ""
+
+def clean_ai_json_text(response_text):
+    """Strip markdown code fences that Gemini sometimes wraps around JSON"""
+    response_text = response_text.strip()
+    if response_text.startswith('```json'):
+        response_text = response_text[7:-3].strip()
+    elif response_text.startswith('```'):
+        response_text = response_text[3:-3].strip()
+    return response_text
+
+# ===== AI RESULT CACHE =====
+# One LRU per kind of AI result
+AI_CACHE_NAMES = ('categorize', 'summarize', 'extract_meeting')
+# Meeting extractions resolve relative dates against the day they ran, so they stay in memory
+PERSISTED_AI_CACHE_NAMES = ('categorize', 'summarize')
+ai_cache_lock = threading.Lock()
+
+def read_ai_cache_file():
+    """Read the AI results persisted on disk, or None if there are none"""
+    try:
+        with open(AI_CACHE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️ Error loading AI cache: {e}")
+    return None
+
+def load_ai_cache():
+    """Load cached AI results from disk, starting empty if unavailable"""
+    cache = read_ai_cache_file() or {}
+    return {
+        name: OrderedDict(cache.get(name, {}) if name in PERSISTED_AI_CACHE_NAMES else {})
+        for name in AI_CACHE_NAMES
+    }
+
+def save_ai_cache():
+    """Persist cached AI results so restarts keep previous entries"""
+    try:
+        with ai_cache_lock:
+            snapshot = {name: dict(ai_cache[name]) for name in PERSISTED_AI_CACHE_NAMES}
+        # Merge with what other processes saved, our entries being the most recent
+        on_disk = read_ai_cache_file() or {}
+        for name, entries in snapshot.items():
+            merged = {**on_disk.get(name, {}), **entries}
+            snapshot[name] = dict(list(merged.items())[-AI_CACHE_MAX_ENTRIES:])
+        # Write a temporary file and swap it in, so readers never see a partial cache
+        temp_file = f"{AI_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(orjson.dumps(snapshot, default=str))
+        os.replace(temp_file, AI_CACHE_FILE)
+    except Exception as e:
+        print(f"⚠️ Error saving AI cache: {e}")
+
+ai_cache = load_ai_cache()
+atexit.register(save_ai_cache)
+
+def ai_cache_key(*parts):
+    """Build a stable hash of the prompt inputs"""
+    return hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+def get_cached_ai_result(cache_name, key):
+    """Return a cached AI result, marking it as recently used"""
+    with ai_cache_lock:
+        entries = ai_cache[cache_name]
+        if key in entries:
+            entries.move_to_end(key)
+            return entries[key]
+    return None
+
+def clear_ai_cache(cache_name):
+    """Forget every cached AI result of one kind"""
+    with ai_cache_lock:
+        ai_cache[cache_name].clear()
+
+def store_ai_result(cache_name, key, result):
+    """Store an AI result, evicting the least recently used entries"""
+    with ai_cache_lock:
+        entries = ai_cache[cache_name]
+        entries[key] = result
+        entries.move_to_end(key)
+        while len(entries) > AI_CACHE_MAX_ENTRIES:
+            entries.popitem(last=False)
+
+# Body characters scanned by the rule-based categorizer
+FALLBACK_BODY_SCAN_CHARS = 4000
+
+# Keyword groups used by the rule-based categorizer
+FALLBACK_KEYWORDS = {
     # High urgency keywords
-    high_urgency_keywords = [
+    'urgent': [
         'urgent', 'asap', 'emergency', 'critical', 'deadline', 'immediate',
         'important', '!!!', 'priority', 'expires', 'due today'
-    ]
-    
+    ],
     # Meeting keywords
-    meeting_keywords = [
+    'meeting': [
         'meeting', 'schedule', 'appointment', 'call', 'conference',
         'zoom', 'teams', 'meet', 'calendar', 'booking', 'available'
-    ]
-    
+    ],
     # Task keywords
-    task_keywords = [
+    'task': [
         'task', 'todo', 'action', 'review', 'complete', 'deadline',
         'project', 'assignment', 'deliverable'
-    ]
-    
+    ],
     # Spam indicators
-    spam_keywords = [
+    'spam': [
         'unsubscribe', 'promotion', 'offer', 'deal', 'discount',
         'free', 'winner', 'congratulations', 'click here'
     ]
+}
+
+FALLBACK_KEYWORD_GROUPS = {}
+for group, keywords in FALLBACK_KEYWORDS.items():
+    for keyword in keywords:
+        FALLBACK_KEYWORD_GROUPS.setdefault(keyword, set()).add(group)
+
+# Zero-width lookahead so overlapping keywords are all reported in a single scan
+FALLBACK_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for k in sorted(FALLBACK_KEYWORD_GROUPS, key=len, reverse=True)) + '))'
+)
+
+def categorize_email_fallback(email):
+    """Fallback categorization when AI is unavailable"""
+    # Keywords show up early, so long bodies are only scanned up to a prefix
+    body = email.get('body', '')[:FALLBACK_BODY_SCAN_CHARS]
+    
+    # Combine text for analysis, lowercasing once
+    text = f"{email.get('subject', '')} {body} {email.get('snippet', '')}".lower()
+    
+    # One pass over the text collects every keyword group that matched
+    matched_groups = {
+        group
+        for keyword in FALLBACK_KEYWORD_RE.findall(text)
+        for group in FALLBACK_KEYWORD_GROUPS[keyword]
+    }
     
     # Determine urgency
     urgency = 'low'
-    if any(keyword in text for keyword in high_urgency_keywords):
+    if 'urgent' in matched_groups:
         urgency = 'high'
-    elif any(keyword in text for keyword in meeting_keywords + task_keywords):
+    elif 'meeting' in matched_groups or 'task' in matched_groups:
         urgency = 'medium'
     
     # Determine category
     category = 'information'
     is_meeting_request = False
     
-    if any(keyword in text for keyword in spam_keywords):
+    if 'spam' in matched_groups:
         category = 'spam'
-    elif any(keyword in text for keyword in meeting_keywords):
+    elif 'meeting' in matched_groups:
         category = 'meeting'
         is_meeting_request = True
     elif any(personal in email.get('sender', '').lower() for personal in ['gmail.com', 'yahoo.com', 'hotmail.com']):
@@ -388,87 +741,60 @@ def categorize_email_fallback(email):
         "is_meeting_request": is_meeting_request
     }
 
-def categorize_email_with_ai(email):
-    """Use Gemini AI to categorize email by urgency and type with fallback"""
-    # Always try fallback first to avoid quota issues
-    fallback_result = categorize_email_fallback(email)
+def is_fallback_categorization_final(email, fallback_result):
+    """Spam hits and emails without a snippet gain nothing from an AI pass"""
+    return fallback_result['category'] == 'spam' or not email.get('snippet', '').strip()
+
+def categorize_emails_batch(emails):
+    """Categorize several emails with a single Gemini request, falling back per email"""
+    results = [categorize_email_fallback(email) for email in emails]
     
     if not model:
-        print("⚠️ AI model unavailable, using rule-based categorization")
-        return fallback_result
+        return results
+    
+    # Only send emails that are not already cached
+    pending = []
+    for i, email in enumerate(emails):
+        if is_fallback_categorization_final(email, results[i]):
+            continue
+        cache_key = ai_cache_key(email['subject'][:200], email['sender'][:100], email['snippet'][:300])
+        cached_result = get_cached_ai_result('categorize', cache_key)
+        if cached_result is not None:
+            results[i] = dict(cached_result)
+        else:
+            pending.append((i, cache_key))
+    
+    if not pending:
+        return results
     
     try:
-        prompt = f"""
-        Analyze this email and categorize it. Respond ONLY with valid JSON format.
-        
-        Subject: {email['subject'][:200]}
-        From: {email['sender'][:100]}
-        Content: {email['snippet'][:300]}
-        
-        Return exactly this JSON structure with no additional text:
-        {{
-            "urgency": "high|medium|low",
-            "category": "meeting|task|information|personal|spam",
-            "action_required": true|false,
-            "confidence": 0.8,
-            "reason": "brief explanation",
-            "is_meeting_request": true|false
-        }}
-        """
-        
-        # Add retry mechanism with exponential backoff
-        max_retries = 2
-        base_delay = 1
+        email_fields = "".join(
+            f"\n        Email {n}:" + EMAIL_FIELDS_TEMPLATE.format(
+                subject=emails[i]['subject'][:200], sender=emails[i]['sender'][:100], content=emails[i]['snippet'][:300]
+            )
+            for n, (i, _) in enumerate(pending, 1)
+        )
         
-        for attempt in range(max_retries):
-            try:
-                response = model.generate_content(prompt)
-                if response and hasattr(response, 'text') and response.text:
-                    # Clean the response text
-                    response_text = response.text.strip()
-                    
-                    # Extract JSON from the response
-                    if response_text.startswith('```json'):
-                        response_text = response_text[7:-3].strip()
-                    elif response_text.startswith('```'):
-                        response_text = response_text[3:-3].strip()
-                    
-                    # Try to parse JSON
-                    result = json.loads(response_text)
-                    
-                    # Validate required fields
-                    required_fields = ["urgency", "category", "action_required", "confidence", "reason", "is_meeting_request"]
-                    if all(field in result for field in required_fields):
-                        return result
-                    else:
-                        print(f"⚠️ AI response missing required fields, using fallback")
-                        return fallback_result
-                        
-            except json.JSONDecodeError as e:
-                print(f"⚠️ JSON parsing error (attempt {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    return fallback_result
-                time.sleep(base_delay * (2 ** attempt))
-                
-            except Exception as e:
-                error_str = str(e)
-                if "429" in error_str or "quota" in error_str.lower():
-                    print(f"⚠️ Rate limit hit, using fallback categorization")
-                    return fallback_result
-                elif "400" in error_str:
-                    print(f"⚠️ Bad request, using fallback categorization")
-                    return fallback_result
-                else:
-                    print(f"⚠️ AI error (attempt {attempt + 1}): {e}")
-                    if attempt == max_retries - 1:
-                        return fallback_result
-                    time.sleep(base_delay * (2 ** attempt))
-                    
-        return fallback_result
+        prompt = build_ai_prompt(BATCH_CATEGORIZE_INSTRUCTIONS, email_fields)
+        response_text = get_response_text(model.generate_content(prompt))
+        if response_text:
+            parsed = orjson.loads(clean_ai_json_text(response_text))
+            if not isinstance(parsed, list) or len(parsed) != len(pending):
+                print(f"⚠️ AI batch response has unexpected shape, using fallback for malformed items")
+            
+            for (i, cache_key), result in zip(pending, parsed if isinstance(parsed, list) else []):
+                if isinstance(result, dict) and all(field in result for field in CATEGORY_REQUIRED_FIELDS):
+                    store_ai_result('categorize', cache_key, result)
+                    results[i] = dict(result)
         
     except Exception as error:
-        print(f"⚠️ AI categorization failed: {error}")
-        return fallback_result
+        error_str = str(error)
+        if "429" in error_str or "quota" in error_str.lower():
+            print(f"⚠️ Rate limit hit, using fallback categorization for batch")
+        else:
+            print(f"⚠️ AI batch categorization failed: {error}")
+    
+    return results
 
 def summarize_email_fallback(email):
     """Fallback summarization when AI is unavailable"""
@@ -496,24 +822,25 @@ def summarize_email_with_ai(email):
         return fallback_summary
     
     try:
-        content_text = email.get('body', email.get('snippet', ''))[:500]
+        content_text = (email.get('body') or email.get('snippet', ''))[:500]
         if not content_text.strip():
             return fallback_summary
-            
-        prompt = f"""
-        Summarize this email in 1-2 concise sentences. Focus on key points and action items.
         
-        Subject: {email['subject'][:200]}
-        From: {email['sender'][:100]}
-        Content: {content_text}
-        
-        Provide only the summary, no additional formatting.
-        """
+        cache_key = ai_cache_key(email['subject'][:200], email['sender'][:100], content_text)
+        cached_summary = get_cached_ai_result('summarize', cache_key)
+        if cached_summary is not None:
+            return cached_summary
+            
+        prompt = build_ai_prompt(SUMMARIZE_INSTRUCTIONS, EMAIL_FIELDS_TEMPLATE.format(
+            subject=email['subject'][:200], sender=email['sender'][:100], content=content_text
+        ))
         
         response = model.generate_content(prompt)
-        if response and hasattr(response, 'text') and response.text:
-            ai_summary = response.text.strip()
+        response_text = get_response_text(response)
+        if response_text:
+            ai_summary = response_text.strip()
             if len(ai_summary) > 10 and len(ai_summary) < 500:
+                store_ai_result('summarize', cache_key, ai_summary)
                 return ai_summary
         
         return fallback_summary
@@ -533,13 +860,23 @@ def process_emails_with_ai(emails):
     
     print(f"📧 Processing {len(emails)} emails...")
     
+    # Gemini calls are IO-bound, so overlap them across a thread pool.
+    # Categorization is sent in chunks so each request covers several emails.
+    batch_size = AI_CATEGORIZE_BATCH_SIZE
+    with ThreadPoolExecutor(max_workers=AI_MAX_WORKERS) as executor:
+        category_futures = [
+            executor.submit(categorize_emails_batch, emails[i:i + batch_size])
+            for i in range(0, len(emails), batch_size)
+        ]
+        summary_futures = [executor.submit(summarize_email_with_ai, email) for email in emails]
+    
     for i, email in enumerate(emails):
         try:
             print(f"Processing email {i+1}/{len(emails)}: {email.get('subject', 'No Subject')[:50]}...")
             
             # Add AI analysis with fallback
-            ai_analysis = categorize_email_with_ai(email)
-            ai_summary = summarize_email_with_ai(email)
+            ai_analysis = category_futures[i // batch_size].result()[i % batch_size]
+            ai_summary = summary_futures[i].result()
             
             # Combine original email with AI insights
             processed_email = {
@@ -582,6 +919,37 @@ def process_emails_with_ai(emails):
     
     return processed_emails, meeting_requests
 
+# Common date patterns
+MEETING_DATE_PATTERNS = [
+    r'tomorrow',
+    r'today',
+    r'next week',
+    r'monday|tuesday|wednesday|thursday|friday|saturday|sunday',
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+    r'\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{2,4}',
+    r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}(?:st|nd|rd|th)?'
+]
+
+# Common time patterns
+MEETING_TIME_PATTERNS = [
+    r'\d{1,2}:\d{2}\s*(?:am|pm)',
+    r'\d{1,2}\s*(?:am|pm)',
+    r'\d{1,2}:\d{2}\s*(?:am|pm)\s*(?:to|-)\s*\d{1,2}:\d{2}\s*(?:am|pm)',
+    r'\d{1,2}\s*(?:am|pm)\s*(?:to|-)\s*\d{1,2}\s*(?:am|pm)'
+]
+
+MEETING_DATE_RE = re.compile('|'.join(f'(?:{p})' for p in MEETING_DATE_PATTERNS), re.IGNORECASE)
+MEETING_TIME_RE = re.compile('|'.join(f'(?:{p})' for p in MEETING_TIME_PATTERNS), re.IGNORECASE)
+EMAIL_ADDRESS_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+
+def extract_sender_address(sender):
+    """Get the first address from a From header, using the regex only for malformed headers"""
+    addresses = [address for _, address in getaddresses([sender]) if '@' in address]
+    if addresses:
+        return addresses[0]
+    sender_email_match = EMAIL_ADDRESS_RE.search(sender)
+    return sender_email_match.group(0) if sender_email_match else None
+
 def extract_meeting_details_fallback(email):
     """Fallback meeting details extraction using patterns"""
     subject = email.get('subject', '')
@@ -590,8 +958,7 @@ def extract_meeting_details_fallback(email):
     sender = email.get('sender', '')
     
     # Extract sender email
-    sender_email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', sender)
-    participant_email = sender_email_match.group(0) if sender_email_match else None
+    participant_email = extract_sender_address(sender)
     
     # Use subject as event name by default
     event_name = subject.strip() if subject and 'Re:' not in subject else 'Meeting Request'
@@ -599,41 +966,11 @@ def extract_meeting_details_fallback(email):
     # Look for dates in text
     text = f"{subject} {body} {snippet}".lower()
     
-    # Common date patterns
-    date_patterns = [
-        r'tomorrow',
-        r'today',
-        r'next week',
-        r'monday|tuesday|wednesday|thursday|friday|saturday|sunday',
-        r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-        r'\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{2,4}',
-        r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}(?:st|nd|rd|th)?'
-    ]
-    
-    # Common time patterns
-    time_patterns = [
-        r'\d{1,2}:\d{2}\s*(?:am|pm)',
-        r'\d{1,2}\s*(?:am|pm)',
-        r'\d{1,2}:\d{2}\s*(?:am|pm)\s*(?:to|-)\s*\d{1,2}:\d{2}\s*(?:am|pm)',
-        r'\d{1,2}\s*(?:am|pm)\s*(?:to|-)\s*\d{1,2}\s*(?:am|pm)'
-    ]
-    
-    found_date = None
-    found_time = None
-    
-    # Search for dates
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            found_date = matches[0]
-            break
-    
-    # Search for times
-    for pattern in time_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            found_time = matches[0]
-            break
+    # Single scan per field over all known patterns
+    date_match = MEETING_DATE_RE.search(text)
+    time_match = MEETING_TIME_RE.search(text)
+    found_date = date_match.group(0) if date_match else None
+    found_time = time_match.group(0) if time_match else None
     
     # Try to parse the found date
     parsed_date = None
@@ -646,7 +983,7 @@ def extract_meeting_details_fallback(email):
                 today = datetime.now()
                 parsed_date = today.strftime('%Y-%m-%d')
             else:
-                parsed = dateparser.parse(found_date, settings={'PREFER_DATES_FROM': 'future'})
+                parsed = parse_user_date(found_date)
                 if parsed and parsed.date() >= datetime.now().date():
                     parsed_date = parsed.strftime('%Y-%m-%d')
         except:
@@ -664,6 +1001,18 @@ def extract_meeting_details_fallback(email):
 
 def extract_meeting_details_from_email(email):
     """Extract meeting details from email using AI with fallback"""
+    # Gmail messages are immutable, but relative dates ("tomorrow") in an extraction only
+    # hold for the day it ran, so the day is part of the key
+    today = datetime.now().date().isoformat()
+    cache_key = ai_cache_key(email['id'], email.get('subject', ''), today)
+    cached_details = get_cached_ai_result('extract_meeting', cache_key)
+    if cached_details is not None and not (cached_details.get('event_date') or today) < today:
+        return dict(cached_details)
+    
+    # Inbox listings only carry metadata, so load the body for this path
+    if not email.get('body') and services and 'gmail' in services:
+        email['body'] = fetch_email_body(services['gmail'], email['id'])
+    
     # Try fallback first to avoid quota issues
     fallback_result = extract_meeting_details_fallback(email)
     
@@ -671,52 +1020,28 @@ def extract_meeting_details_from_email(email):
         return fallback_result
     
     try:
-        content_text = email.get('body', email.get('snippet', ''))[:800]
-        
-        prompt = f"""
-        Extract meeting details from this email. Return ONLY valid JSON format.
+        content_text = (email.get('body') or email.get('snippet', ''))[:800]
         
-        Subject: {email['subject'][:200]}
-        From: {email['sender'][:100]}
-        Body: {content_text}
-        
-        Extract and return exactly this JSON structure:
-        {{
-            "participant_email": "sender email address or null",
-            "event_name": "meeting title or null", 
-            "event_date": "YYYY-MM-DD format or null",
-            "event_time": "time range like '10:00 AM to 11:00 AM' or null",
-            "has_complete_info": true|false
-        }}
-        
-        Rules:
-        - Extract sender email from sender field
-        - Use future dates only
-        - Set has_complete_info to true only if ALL fields have valid values
-        """
+        prompt = build_ai_prompt(MEETING_EXTRACTION_INSTRUCTIONS, MEETING_FIELDS_TEMPLATE.format(
+            subject=email['subject'][:200], sender=email['sender'][:100], body=content_text
+        ))
         
         response = model.generate_content(prompt)
-        if response and hasattr(response, 'text') and response.text:
-            response_text = response.text.strip()
-            
-            # Clean JSON formatting
-            if response_text.startswith('```json'):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith('```'):
-                response_text = response_text[3:-3].strip()
-            
-            details = json.loads(response_text)
+        response_text = get_response_text(response)
+        if response_text:
+            details = orjson.loads(clean_ai_json_text(response_text))
             
             # Extract sender email if not properly extracted
             if not details.get('participant_email'):
-                sender_email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', email['sender'])
-                if sender_email_match:
-                    details['participant_email'] = sender_email_match.group(0)
+                sender_address = extract_sender_address(email['sender'])
+                if sender_address:
+                    details['participant_email'] = sender_address
             
             # Validate the result has required fields
             required_fields = ['participant_email', 'event_name', 'event_date', 'event_time', 'has_complete_info']
             if all(field in details for field in required_fields):
-                return details
+                store_ai_result('extract_meeting', cache_key, details)
+                return dict(details)
             
         return fallback_result
         
@@ -729,111 +1054,517 @@ def extract_meeting_details_from_email(email):
         return fallback_result
 
 # ===== ENHANCED MEETING TRACKING =====
+authenticated_user_email = None
+
 def get_authenticated_user_email():
-    """Get the email address of the authenticated user"""
+    """Get the email address of the authenticated user, cached after the first lookup"""
+    global authenticated_user_email
+    if authenticated_user_email:
+        return authenticated_user_email
+    # A failed lookup is not retried within the same request
+    if has_request_context() and g.get('user_email_lookup_failed'):
+        return None
     try:
         if services and 'gmail' in services:
             profile = services['gmail'].users().getProfile(userId='me').execute()
-            return profile.get('emailAddress')
+            authenticated_user_email = profile.get('emailAddress')
+            if authenticated_user_email:
+                return authenticated_user_email
     except Exception as e:
         print(f"⚠️ Error getting user email: {e}")
+    if has_request_context():
+        g.user_email_lookup_failed = True
     return None
 
-def get_scheduled_meetings_from_calendar():
-    """Fetch actual scheduled meetings from Google Calendar"""
+# Only the event fields read when building meeting records
+CALENDAR_EVENT_FIELDS = (
+    'items(id,status,summary,start,end,created,conferenceData/entryPoints,'
+    'organizer/email,creator/email,attendees/email)'
+)
+# Largest page events.list allows, so a full window is usually one round-trip
+CALENDAR_PAGE_SIZE = 2500
+
+calendar_events_cache = {}
+calendar_events_cache_lock = threading.Lock()
+
+def event_end_timestamp(event):
+    """Get a calendar event's end as a UTC epoch, parsed once when it is cached"""
+    end = event.get('end', {})
+    if end.get('dateTime'):
+        return datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00')).timestamp()
+    if end.get('date'):
+        # All-day end dates are exclusive, so the event is over at that midnight
+        return datetime.fromisoformat(end['date']).replace(tzinfo=timezone.utc).timestamp()
+    return float('inf')
+
+def list_upcoming_calendar_events(calendar_service, days=30, max_results=50):
+    """List upcoming events, refreshing a cached window with an updatedMin delta"""
+    now = datetime.now(timezone.utc)
+    window_end = now + timedelta(days=days)
+    time_min = to_rfc3339_utc(now)
+    time_max = to_rfc3339_utc(window_end)
+    cache_key = (now.date().isoformat(), window_end.date().isoformat())
+    
+    with calendar_events_cache_lock:
+        entry = calendar_events_cache.get(cache_key)
+    
+    if entry and time.time() - entry['fetched_at'] < EMAIL_CONFIG['cache_duration']:
+        # Only ask for events changed since the last fetch; cancelled ones are removals.
+        # syncToken is not used: it cannot be combined with the timeMin/timeMax window.
+        events_by_id = dict(entry['events'])
+        ends_at = dict(entry['ends_at'])
+        page_token = None
+        while True:
+            delta_result = calendar_service.events().list(
+                calendarId='primary',
+                timeMin=time_min,
+                timeMax=time_max,
+                updatedMin=entry['updated_min'],
+                maxResults=CALENDAR_PAGE_SIZE,
+                singleEvents=True,
+                showDeleted=True,
+                pageToken=page_token,
+                fields=f"{CALENDAR_EVENT_FIELDS},nextPageToken"
+            ).execute()
+            for event in delta_result.get('items', []):
+                if event.get('status') == 'cancelled':
+                    events_by_id.pop(event['id'], None)
+                    ends_at.pop(event['id'], None)
+                else:
+                    events_by_id[event['id']] = event
+                    ends_at[event['id']] = event_end_timestamp(event)
+            page_token = delta_result.get('nextPageToken')
+            if not page_token:
+                break
+        fetched_at = entry['fetched_at']
+    else:
+        # Cache the whole window so later delta merges start from a complete set
+        events_by_id = {}
+        page_token = None
+        while True:
+            events_result = calendar_service.events().list(
+                calendarId='primary',
+                timeMin=time_min,
+                timeMax=time_max,
+                maxResults=CALENDAR_PAGE_SIZE,
+                singleEvents=True,
+                pageToken=page_token,
+                fields=f"{CALENDAR_EVENT_FIELDS},nextPageToken"
+            ).execute()
+            for event in events_result.get('items', []):
+                events_by_id[event['id']] = event
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+        ends_at = {event_id: event_end_timestamp(event) for event_id, event in events_by_id.items()}
+        fetched_at = time.time()
+    
+    # Drop events that ended since they were cached
+    now_ts = now.timestamp()
+    events_by_id = {
+        event_id: event for event_id, event in events_by_id.items()
+        if ends_at[event_id] > now_ts
+    }
+    ends_at = {event_id: ends_at[event_id] for event_id in events_by_id}
+    
+    with calendar_events_cache_lock:
+        calendar_events_cache.clear()
+        calendar_events_cache[cache_key] = {
+            'events': events_by_id,
+            'ends_at': ends_at,
+            'fetched_at': fetched_at,
+            # Small overlap so edits made during this request are not missed
+            'updated_min': to_rfc3339_utc(now - timedelta(seconds=5))
+        }
+    
+    events = sorted(
+        events_by_id.values(),
+        key=lambda e: e.get('start', {}).get('dateTime', e.get('start', {}).get('date', ''))
+    )
+    return events[:max_results]
+
+# Seconds an empty calendar result is trusted before Calendar is asked again
+EMPTY_CALENDAR_TTL = 30
+# Monotonic time of the last empty calendar result (0 when unknown or stale)
+empty_calendar_checked_at = 0.0
+
+def calendar_recently_empty():
+    """Check whether Calendar had no meetings within the last EMPTY_CALENDAR_TTL seconds"""
+    return bool(empty_calendar_checked_at) and time.monotonic() - empty_calendar_checked_at < EMPTY_CALENDAR_TTL
+
+# Only the event fields the delete picker reads
+DELETE_CANDIDATE_FIELDS = 'items(id,summary,start,organizer/email,creator/email,attendees/email)'
+# Seconds the delete picker's event listing is reused across chat turns
+DELETE_CANDIDATES_TTL = 45
+delete_candidates_cache = {}
+delete_candidates_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=4)
+def delete_candidate_window(minute_bucket):
+    """Build the delete picker's timeMin/timeMax once per wall-clock minute"""
+    now = datetime.fromtimestamp(minute_bucket * 60, timezone.utc)
+    return to_rfc3339_utc(now - timedelta(days=1)), to_rfc3339_utc(now + timedelta(days=30))
+
+def list_delete_candidate_events(calendar_service, user_email):
+    """List events from yesterday through the next 30 days, reused briefly across turns"""
+    with delete_candidates_cache_lock:
+        entry = delete_candidates_cache.get(user_email)
+    if entry and time.monotonic() - entry['fetched_at'] < DELETE_CANDIDATES_TTL:
+        return entry['events']
+    
+    time_min, time_max = delete_candidate_window(int(time.time() // 60))
+    
+    events_result = calendar_service.events().list(
+        calendarId='primary',
+        timeMin=time_min,
+        timeMax=time_max,
+        maxResults=20,  # Increased to show more options
+        singleEvents=True,
+        orderBy='startTime',
+        fields=DELETE_CANDIDATE_FIELDS
+    ).execute()
+    
+    events = events_result.get('items', [])
+    with delete_candidates_cache_lock:
+        delete_candidates_cache[user_email] = {'events': events, 'fetched_at': time.monotonic()}
+    return events
+
+# Seconds a calendar meeting listing is served without asking Calendar again
+CALENDAR_MEETINGS_FRESH_TTL = 60
+# Seconds a stale listing is still served while it is refreshed in the background
+CALENDAR_MEETINGS_STALE_TTL = 900
+calendar_meetings_cache = {}
+calendar_meetings_cache_lock = threading.Lock()
+# Bumped on every invalidation so refreshes started earlier do not store old data
+calendar_meetings_generation = 0
+calendar_meetings_refreshing = set()
+
+def refresh_calendar_meetings_cache(cache_key, max_results, generation):
+    """Fetch the calendar meeting listing and cache it unless it was invalidated meanwhile"""
     try:
-        if not services or 'calendar' not in services:
-            return []
-        
-        # Get current time and next 30 days
-        now = datetime.utcnow()
-        time_min = now.isoformat() + 'Z'
-        time_max = (now + timedelta(days=30)).isoformat() + 'Z'
-        
-        # Fetch events from calendar
-        events_result = services['calendar'].events().list(
-            calendarId='primary',
-            timeMin=time_min,
-            timeMax=time_max,
-            maxResults=50,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+        scheduled_meetings = fetch_scheduled_meetings_from_calendar(max_results)
+    except Exception as e:
+        print(f"⚠️ Error fetching scheduled meetings from calendar: {e}")
+        return None
+    finally:
+        with calendar_meetings_cache_lock:
+            calendar_meetings_refreshing.discard(cache_key)
+    
+    with calendar_meetings_cache_lock:
+        if generation == calendar_meetings_generation:
+            calendar_meetings_cache[cache_key] = {
+                'meetings': scheduled_meetings,
+                'fetched_at': time.monotonic()
+            }
+    return scheduled_meetings
+
+def get_cached_calendar_meetings(max_results=50):
+    """Get the calendar meeting listing, serving stale data while it is revalidated"""
+    if not services or 'calendar' not in services:
+        return []
+    
+    cache_key = (get_authenticated_user_email(), max_results)
+    with calendar_meetings_cache_lock:
+        entry = calendar_meetings_cache.get(cache_key)
+        generation = calendar_meetings_generation
+        age = time.monotonic() - entry['fetched_at'] if entry else None
+        refresh_in_background = (
+            age is not None
+            and CALENDAR_MEETINGS_FRESH_TTL <= age < CALENDAR_MEETINGS_STALE_TTL
+            and cache_key not in calendar_meetings_refreshing
+        )
+        if refresh_in_background:
+            calendar_meetings_refreshing.add(cache_key)
+    
+    if age is not None and age < CALENDAR_MEETINGS_FRESH_TTL:
+        return entry['meetings']
+    if age is not None and age < CALENDAR_MEETINGS_STALE_TTL:
+        if refresh_in_background:
+            threading.Thread(
+                target=refresh_calendar_meetings_cache,
+                args=(cache_key, max_results, generation),
+                name='calendar-refresh',
+                daemon=True
+            ).start()
+        return entry['meetings']
+    
+    scheduled_meetings = refresh_calendar_meetings_cache(cache_key, max_results, generation)
+    if scheduled_meetings is None:
+        return entry['meetings'] if entry else []
+    return scheduled_meetings
+
+def get_scheduled_meetings_from_calendar(max_results=50):
+    """Get scheduled meetings from Google Calendar, fetched at most once per request"""
+    if has_request_context() and 'calendar_meetings' in g:
+        return g.calendar_meetings
+    
+    return remember_calendar_meetings(get_cached_calendar_meetings(max_results))
+
+def remember_calendar_meetings(scheduled_meetings):
+    """Memoize a calendar result for this request and note whether it was empty"""
+    global empty_calendar_checked_at
+    empty_calendar_checked_at = 0.0 if scheduled_meetings else time.monotonic()
+    if has_request_context():
+        g.calendar_meetings = scheduled_meetings
+    return scheduled_meetings
+
+def invalidate_scheduled_meetings():
+    """Forget cached and memoized meetings after a calendar or session change"""
+    global empty_calendar_checked_at, calendar_meetings_generation
+    empty_calendar_checked_at = 0.0
+    with calendar_meetings_cache_lock:
+        calendar_meetings_cache.clear()
+        calendar_meetings_generation += 1
+    with delete_candidates_cache_lock:
+        delete_candidates_cache.clear()
+    if has_request_context():
+        g.pop('calendar_meetings', None)
+        g.pop('all_scheduled_meetings', None)
+        g.pop('scheduled_meeting_counts', None)
+        g.pop('scheduled_meetings_by_id', None)
+
+def fetch_scheduled_meetings_from_calendar(max_results=50):
+    """Fetch actual scheduled meetings from Google Calendar; API errors propagate"""
+    # Events for the next 30 days, served from the incremental cache
+    events = list_upcoming_calendar_events(services['calendar'], max_results=max_results)
+    user_email = get_authenticated_user_email()
+    user_email_lower = user_email.lower() if user_email else None
+    
+    scheduled_meetings = []
+    
+    for event in events:
+        # Check if this event has attendees (indicating it's a meeting)
+        attendees = event.get('attendees', [])
+        if not attendees:
+            continue
         
-        events = events_result.get('items', [])
-        user_email = get_authenticated_user_email()
+        # Check if the authenticated user is the organizer
+        organizer = event.get('organizer', {})
+        creator = event.get('creator', {})
         
-        scheduled_meetings = []
+        is_user_organizer = bool(user_email_lower) and (
+            organizer.get('email', '').lower() == user_email_lower or
+            creator.get('email', '').lower() == user_email_lower
+        )
         
-        for event in events:
-            # Check if this event has attendees (indicating it's a meeting)
-            attendees = event.get('attendees', [])
-            if not attendees:
-                continue
-            
-            # Check if the authenticated user is the organizer
-            organizer = event.get('organizer', {})
-            creator = event.get('creator', {})
-            
-            is_user_organizer = (
-                organizer.get('email', '').lower() == user_email.lower() if user_email else False or
-                creator.get('email', '').lower() == user_email.lower() if user_email else False
+        if is_user_organizer:
+            # Extract meeting details
+            start_time = event.get('start', {})
+            start_datetime = start_time.get('dateTime')
+            end_datetime = event.get('end', {}).get('dateTime')
+            # RFC 3339 dateTime: YYYY-MM-DDTHH:MM:SS..., so fixed slices avoid split()
+            start_hhmm = start_datetime[11:16] if start_datetime else 'All day'
+            end_hhmm = end_datetime[11:16] if end_datetime else 'All day'
+            
+            # Get meeting link from conference data
+            meeting_link = next(
+                (
+                    entry_point['uri']
+                    for entry_point in event.get('conferenceData', {}).get('entryPoints', ())
+                    if entry_point.get('entryPointType') == 'video'
+                ),
+                ""
             )
             
-            if is_user_organizer:
-                # Extract meeting details
-                start_time = event.get('start', {})
-                end_time = event.get('end', {})
-                
-                # Get meeting link from conference data
-                meeting_link = ""
-                if 'conferenceData' in event and 'entryPoints' in event['conferenceData']:
-                    for entry_point in event['conferenceData']['entryPoints']:
-                        if entry_point['entryPointType'] == 'video':
-                            meeting_link = entry_point['uri']
-                            break
-                
-                # Get participant emails
-                participant_emails = [
+            # Get participant emails
+            participant_emails = [
                 attendee['email']
                 for attendee in attendees
-                if not user_email or attendee['email'].lower() != user_email.lower()
+                if not user_email_lower or attendee['email'].lower() != user_email_lower
             ]
-
-                
-                meeting_record = {
-                    'id': f"cal_{event['id']}",
-                    'event_name': event.get('summary', 'Untitled Meeting'),
-                    'participant_emails': participant_emails,
-                    'participant_email': participant_emails[0] if participant_emails else 'No participants',
-                    'event_date': start_time.get('dateTime', start_time.get('date', '')).split('T')[0] if start_time else '',
-                    'event_time': f"{start_time.get('dateTime', '').split('T')[1][:5] if start_time.get('dateTime') else 'All day'} - {end_time.get('dateTime', '').split('T')[1][:5] if end_time.get('dateTime') else 'All day'}",
-                    'meeting_link': meeting_link,
-                    'scheduled_at': event.get('created', ''),
-                    'status': 'scheduled',
-                    'calendar_event_id': event['id'],
-                    'organizer': organizer.get('email', ''),
-                    'attendee_count': len(attendees)
-                }
-                
-                scheduled_meetings.append(meeting_record)
-        
-        print(f"✅ Found {len(scheduled_meetings)} scheduled meetings from calendar")
-        return scheduled_meetings
-        
-    except Exception as e:
-        print(f"⚠️ Error fetching scheduled meetings from calendar: {e}")
+            
+            meeting_record = {
+                'id': f"cal_{event['id']}",
+                'event_name': event.get('summary', 'Untitled Meeting'),
+                'participant_emails': participant_emails,
+                'participant_email': participant_emails[0] if participant_emails else 'No participants',
+                'event_date': start_datetime[:10] if start_datetime else start_time.get('date', ''),
+                'event_time': f"{start_hhmm} - {end_hhmm}",
+                'meeting_link': meeting_link,
+                'scheduled_at': event.get('created', ''),
+                'status': 'scheduled',
+                'calendar_event_id': event['id'],
+                'organizer': organizer.get('email', ''),
+                'attendee_count': len(attendees),
+                'source': 'calendar'
+            }
+            
+            scheduled_meetings.append(meeting_record)
+    
+    logger.info("✅ Found %d scheduled meetings from calendar", len(scheduled_meetings))
+    return scheduled_meetings
+
+# Redis client for per-session meeting hashes (None keeps meetings in the session itself)
+meeting_store = app.config.get("SESSION_REDIS")
+# Seconds a session's Redis data outlives its last use, matching the session lifetime
+SESSION_MEETINGS_TTL = int(app.config["PERMANENT_SESSION_LIFETIME"].total_seconds())
+
+def session_store_key(name, create=False):
+    """Get the Redis key holding this session's data of the given kind"""
+    # The key lives in the session, so session.clear() forgets the data too
+    if create and f'{name}_key' not in session:
+        session[f'{name}_key'] = f"{name}:{secrets.token_hex(16)}"
+    return session.get(f'{name}_key')
+
+def session_meetings_key(create=False):
+    """Get the Redis hash key for this session's meetings"""
+    return session_store_key('meetings', create)
+
+def save_session_list(name, items):
+    """Store a per-session list (e.g. processed emails) outside the pickled session"""
+    if has_request_context():
+        g.get('session_list_indexes', {}).pop(name, None)
+    if meeting_store is None:
+        session[name] = items
+        return
+    meeting_store.set(session_store_key(name, create=True), orjson.dumps(items, default=str), ex=SESSION_MEETINGS_TTL)
+
+def load_session_list(name):
+    """Get a per-session list stored by save_session_list"""
+    if meeting_store is None:
+        return session.get(name, [])
+    key = session_store_key(name)
+    value = meeting_store.getex(key, ex=SESSION_MEETINGS_TTL) if key else None
+    return orjson.loads(value) if value else []
+
+def find_session_list_item(name, item_id):
+    """Look up one item of a per-session list by id, indexing the list once per request"""
+    indexes = g.setdefault('session_list_indexes', {})
+    if name not in indexes:
+        indexes[name] = {item.get('id'): item for item in load_session_list(name)}
+    return indexes[name].get(item_id)
+
+def count_email_stats(processed_emails, meeting_requests):
+    """Count email categories in a single pass over the processed emails"""
+    stats = {'total': len(processed_emails), 'high_priority': 0, 'action_required': 0,
+             'meeting_requests': 0, 'pending_requests': len(meeting_requests)}
+    for e in processed_emails:
+        if e.get('ai_urgency') == 'high':
+            stats['high_priority'] += 1
+        if e.get('action_required'):
+            stats['action_required'] += 1
+        if e.get('is_meeting_request', False):
+            stats['meeting_requests'] += 1
+    return stats
+
+def save_email_stats(stats):
+    """Store this session's email counters next to the processed emails they describe"""
+    if meeting_store is None:
+        session['email_stats'] = stats
+        return
+    key = session_store_key('email_stats', create=True)
+    pipe = meeting_store.pipeline()
+    pipe.hset(key, mapping=stats)
+    pipe.expire(key, SESSION_MEETINGS_TTL)
+    pipe.execute()
+
+def load_email_stats():
+    """Get this session's email counters, recounting only for data saved before they existed"""
+    if meeting_store is None:
+        stats = session.get('email_stats')
+    else:
+        key = session_store_key('email_stats')
+        stats = None
+        if key:
+            pipe = meeting_store.pipeline()
+            pipe.hgetall(key)
+            pipe.expire(key, SESSION_MEETINGS_TTL)
+            values, _ = pipe.execute()
+            stats = {field.decode(): int(value) for field, value in values.items()} or None
+    if stats is None:
+        stats = count_email_stats(load_session_list('processed_emails'), load_session_list('meeting_requests'))
+    return stats
+
+def load_session_meetings():
+    """Get meetings recorded in this session"""
+    if meeting_store is None:
+        return session.get('scheduled_meetings', [])
+    key = session_meetings_key()
+    if not key:
         return []
+    # Reading extends the hash's lifetime along with the session's
+    pipe = meeting_store.pipeline()
+    pipe.hvals(key)
+    pipe.expire(key, SESSION_MEETINGS_TTL)
+    values, _ = pipe.execute()
+    return [orjson.loads(value) for value in values]
+
+def add_session_meeting(meeting_record):
+    """Record one meeting in this session"""
+    if meeting_store is None:
+        session.setdefault('scheduled_meetings', []).append(meeting_record)
+        session.modified = True
+    else:
+        key = session_meetings_key(create=True)
+        pipe = meeting_store.pipeline()
+        pipe.hset(key, meeting_record['id'], orjson.dumps(meeting_record))
+        pipe.expire(key, SESSION_MEETINGS_TTL)
+        pipe.execute()
+    update_session_meetings_index(added=[meeting_record])
+    invalidate_scheduled_meetings()
+
+def update_session_meeting(meeting_record):
+    """Overwrite one meeting recorded in this session"""
+    if meeting_store is None:
+        session['scheduled_meetings'] = [
+            meeting_record if m['id'] == meeting_record['id'] else m
+            for m in session.get('scheduled_meetings', [])
+        ]
+    else:
+        key = session_meetings_key(create=True)
+        meeting_store.hset(key, meeting_record['id'], orjson.dumps(meeting_record))
+    update_session_meetings_index(added=[meeting_record], removed_ids={meeting_record['id']})
+    invalidate_scheduled_meetings()
+
+def remove_session_meetings(meeting_ids):
+    """Forget the given meetings recorded in this session"""
+    meeting_ids = set(meeting_ids)
+    if not meeting_ids:
+        return
+    if meeting_store is None:
+        if 'scheduled_meetings' in session:
+            session['scheduled_meetings'] = [
+                m for m in session['scheduled_meetings'] if m['id'] not in meeting_ids
+            ]
+    else:
+        key = session_meetings_key()
+        if key:
+            meeting_store.hdel(key, *meeting_ids)
+    update_session_meetings_index(removed_ids=meeting_ids)
+    invalidate_scheduled_meetings()
+
+def session_meetings_for_event(calendar_event_id):
+    """Get this session's meetings for a calendar event from an index loaded once per request"""
+    index = g.get('session_meetings_index') if has_request_context() else None
+    if index is None:
+        index = {}
+        for meeting in load_session_meetings():
+            if meeting.get('calendar_event_id'):
+                index.setdefault(meeting['calendar_event_id'], []).append(meeting)
+        if has_request_context():
+            g.session_meetings_index = index
+    return index.get(calendar_event_id, [])
+
+def update_session_meetings_index(added=(), removed_ids=()):
+    """Apply a session meeting write to this request's event index instead of rebuilding it"""
+    index = g.get('session_meetings_index') if has_request_context() else None
+    if index is None:
+        return
+    for calendar_event_id, meetings in list(index.items()):
+        kept = [meeting for meeting in meetings if meeting['id'] not in removed_ids]
+        if kept:
+            index[calendar_event_id] = kept
+        else:
+            del index[calendar_event_id]
+    for meeting in added:
+        if meeting.get('calendar_event_id'):
+            index.setdefault(meeting['calendar_event_id'], []).append(meeting)
 
 def track_scheduled_meeting(participant_email, event_name, event_date, event_time, meeting_link, calendar_event_id=None):
     """Track scheduled meetings for email reflection"""
     try:
-        # Store in session for current tracking
-        if 'scheduled_meetings' not in session:
-            session['scheduled_meetings'] = []
-        
         meeting_record = {
-            'id': f"scheduled_{int(time.time())}_{hash(event_name) % 10000}",
+            'id': f"scheduled_{int(time.time())}_{secrets.token_hex(4)}",
             'participant_email': participant_email,
             'event_name': event_name,
             'event_date': event_date,
@@ -844,8 +1575,7 @@ def track_scheduled_meeting(participant_email, event_name, event_date, event_tim
             'calendar_event_id': calendar_event_id
         }
         
-        session['scheduled_meetings'].append(meeting_record)
-        session.modified = True
+        add_session_meeting(meeting_record)
         
         print(f"✅ Meeting tracked: {event_name} with {participant_email}")
         return meeting_record
@@ -855,94 +1585,244 @@ def track_scheduled_meeting(participant_email, event_name, event_date, event_tim
         return None
 
 def get_all_scheduled_meetings():
+    """Get all scheduled meetings, merged at most once per request"""
+    if not has_request_context():
+        return merge_scheduled_meetings()
+    if 'all_scheduled_meetings' not in g:
+        g.all_scheduled_meetings = merge_scheduled_meetings()
+    return g.all_scheduled_meetings
+
+def get_scheduled_meeting(meeting_id):
+    """Look up one scheduled meeting by id through an index built once per request"""
+    if not has_request_context():
+        return next((m for m in get_all_scheduled_meetings() if m['id'] == meeting_id), None)
+    if 'scheduled_meetings_by_id' not in g:
+        g.scheduled_meetings_by_id = {m['id']: m for m in get_all_scheduled_meetings()}
+    return g.scheduled_meetings_by_id.get(meeting_id)
+
+def merge_scheduled_meetings():
     """Get all scheduled meetings from both session and calendar"""
     try:
         # Get meetings from session (recently scheduled)
-        session_meetings = session.get('scheduled_meetings', [])
+        session_meetings = load_session_meetings()
         
         # Get meetings from calendar (actual scheduled meetings)
         calendar_meetings = get_scheduled_meetings_from_calendar()
         
-        # Combine and deduplicate
-        all_meetings = []
-        seen_ids = set()
-        
-        # Add calendar meetings first (more authoritative)
-        for meeting in calendar_meetings:
-            if meeting['id'] not in seen_ids:
-                all_meetings.append(meeting)
-                seen_ids.add(meeting['id'])
-        
-        # Add session meetings that aren't already in calendar
-        for meeting in session_meetings:
-            if meeting['id'] not in seen_ids:
-                all_meetings.append(meeting)
-                seen_ids.add(meeting['id'])
+        # Combine and deduplicate by id (calendar entries are more authoritative)
+        merged = {meeting['id']: meeting for meeting in session_meetings}
+        merged.update({meeting['id']: meeting for meeting in calendar_meetings})
         
-        # Sort by date and time
-        all_meetings.sort(key=lambda x: (x.get('event_date', ''), x.get('event_time', '')))
+        # Sort by date and time, computing each key once
+        keyed = [
+            ((meeting.get('event_date') or '', meeting.get('event_time') or ''), meeting)
+            for meeting in merged.values()
+        ]
+        keyed.sort(key=itemgetter(0))
         
-        return all_meetings
+        return [meeting for _, meeting in keyed]
         
     except Exception as e:
         print(f"⚠️ Error getting all scheduled meetings: {e}")
         return []
 
 def get_scheduled_meetings_count():
-    """Get count of all scheduled meetings"""
+    """Get count of all scheduled meetings (served from the per-request merge)"""
     return len(get_all_scheduled_meetings())
 
+def get_scheduled_meeting_counts():
+    """Get (total, from_calendar, from_session) meeting counts, computed once per request"""
+    if has_request_context() and 'scheduled_meeting_counts' in g:
+        return g.scheduled_meeting_counts
+    
+    scheduled_meetings = get_all_scheduled_meetings()
+    from_calendar = sum(1 for m in scheduled_meetings if m.get('source') == 'calendar')
+    counts = (len(scheduled_meetings), from_calendar, len(scheduled_meetings) - from_calendar)
+    if has_request_context():
+        g.scheduled_meeting_counts = counts
+    return counts
+
+# Fields shared by every simulated invitation email
+SIMULATED_INVITATION_TEMPLATE = {
+    'sender': "AI Calendar System <noreply@calendar.ai>",
+    'ai_urgency': 'high',
+    'ai_category': 'meeting',
+    'action_required': True,
+    'confidence': 1.0,
+    'ai_reason': 'Meeting invitation sent',
+    'is_meeting_request': True,
+    'meeting_status': 'invitation_sent'
+}
+
+# Fields shared by every simulated confirmation email
+SIMULATED_CONFIRMATION_TEMPLATE = {
+    'sender': "AI Calendar System <noreply@calendar.ai>",
+    'ai_urgency': 'high',
+    'ai_category': 'meeting',
+    'action_required': False,
+    'confidence': 1.0,
+    'ai_reason': 'Meeting confirmation sent',
+    'is_meeting_request': False,
+    'meeting_status': 'confirmed'
+}
+
 def simulate_meeting_emails():
     """Generate email representations of scheduled meetings"""
+    # Common case: nothing scheduled anywhere, so skip the calendar round trip
+    if calendar_recently_empty() and not load_session_meetings():
+        return []
+    
     scheduled_meetings = get_all_scheduled_meetings()
     simulated_emails = []
+    now_iso = datetime.now().isoformat()
+    timestamp = time.time()
     
     for meeting in scheduled_meetings:
+        meeting_id = meeting['id']
+        event_name = meeting['event_name']
+        event_date = meeting['event_date']
+        event_time = meeting['event_time']
+        sent_date = meeting.get('scheduled_at', now_iso)
+        
         # Create invitation email simulation
         invitation_email = {
-            'id': f"sim_inv_{meeting['id']}",
-            'subject': f"📅 Meeting Invitation: {meeting['event_name']}",
-            'sender': f"AI Calendar System <noreply@calendar.ai>",
-            'date': meeting.get('scheduled_at', datetime.now().isoformat()),
-            'body': f"Meeting invitation sent for {meeting['event_name']} on {meeting['event_date']} at {meeting['event_time']}",
-            'snippet': f"Meeting invitation: {meeting['event_name']} - {meeting['event_date']} {meeting['event_time']}",
-            'thread_id': f"thread_{meeting['id']}_inv",
-            'ai_urgency': 'high',
-            'ai_category': 'meeting',
-            'action_required': True,
-            'confidence': 1.0,
-            'ai_reason': 'Meeting invitation sent',
-            'ai_summary': f"Invitation sent for {meeting['event_name']} meeting",
-            'is_meeting_request': True,
-            'meeting_status': 'invitation_sent',
-            'timestamp': time.time()
+            **SIMULATED_INVITATION_TEMPLATE,
+            'id': f"sim_inv_{meeting_id}",
+            'subject': f"📅 Meeting Invitation: {event_name}",
+            'date': sent_date,
+            'body': f"Meeting invitation sent for {event_name} on {event_date} at {event_time}",
+            'snippet': f"Meeting invitation: {event_name} - {event_date} {event_time}",
+            'thread_id': f"thread_{meeting_id}_inv",
+            'ai_summary': f"Invitation sent for {event_name} meeting",
+            'timestamp': timestamp
         }
         
         # Create confirmation email simulation
         confirmation_email = {
-            'id': f"sim_conf_{meeting['id']}",
-            'subject': f"✅ Meeting Confirmed: {meeting['event_name']}",
-            'sender': f"AI Calendar System <noreply@calendar.ai>",
-            'date': meeting.get('scheduled_at', datetime.now().isoformat()),
-            'body': f"Meeting confirmed for {meeting['event_name']} on {meeting['event_date']} at {meeting['event_time']}. Join link: {meeting.get('meeting_link', 'N/A')}",
-            'snippet': f"Meeting confirmed: {meeting['event_name']} - Google Meet link provided",
-            'thread_id': f"thread_{meeting['id']}_conf",
-            'ai_urgency': 'high',
-            'ai_category': 'meeting',
-            'action_required': False,
-            'confidence': 1.0,
-            'ai_reason': 'Meeting confirmation sent',
-            'ai_summary': f"Meeting {meeting['event_name']} confirmed and scheduled successfully",
-            'is_meeting_request': False,
-            'meeting_status': 'confirmed',
-            'timestamp': time.time()
+            **SIMULATED_CONFIRMATION_TEMPLATE,
+            'id': f"sim_conf_{meeting_id}",
+            'subject': f"✅ Meeting Confirmed: {event_name}",
+            'date': sent_date,
+            'body': f"Meeting confirmed for {event_name} on {event_date} at {event_time}. Join link: {meeting.get('meeting_link', 'N/A')}",
+            'snippet': f"Meeting confirmed: {event_name} - Google Meet link provided",
+            'thread_id': f"thread_{meeting_id}_conf",
+            'ai_summary': f"Meeting {event_name} confirmed and scheduled successfully",
+            'timestamp': timestamp
         }
         
         simulated_emails.extend([invitation_email, confirmation_email])
     
     return simulated_emails
 
+def fetch_emails_with_scheduled_meetings(batch_size):
+    """Fetch inbox emails and calendar meetings concurrently"""
+    # Calendar listing needs the user email; resolve it first so the Gmail
+    # client is not used from two threads at once
+    if not get_authenticated_user_email() or calendar_recently_empty():
+        return fetch_recent_emails(services['gmail'], max_results=batch_size), simulate_meeting_emails()
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        raw_emails_future = executor.submit(fetch_recent_emails, services['gmail'], batch_size)
+        calendar_future = executor.submit(get_cached_calendar_meetings)
+        raw_emails = raw_emails_future.result()
+        # Later lookups in this request reuse the calendar result
+        remember_calendar_meetings(calendar_future.result())
+    
+    # Session access needs the request context, so this stays on the request thread
+    simulated_meeting_emails = simulate_meeting_emails()
+    
+    return raw_emails, simulated_meeting_emails
+
+def assemble_email_payload(batch_size):
+    """Fetch, process and count inbox plus scheduled-meeting emails, once per request"""
+    cache = g.setdefault('email_payloads', {})
+    if batch_size in cache:
+        return cache[batch_size]
+    
+    raw_emails, simulated_meeting_emails = fetch_emails_with_scheduled_meetings(batch_size)
+    if not raw_emails and not simulated_meeting_emails:
+        cache[batch_size] = None
+        return None
+    
+    # Only real emails need AI processing; simulated ones are already categorized
+    processed_real_emails, meeting_requests = process_emails_with_ai(raw_emails)
+    all_processed_emails = simulated_meeting_emails + processed_real_emails
+    
+    # Store in session for later use
+    save_session_list('processed_emails', all_processed_emails)
+    save_session_list('meeting_requests', meeting_requests)
+    email_stats = count_email_stats(all_processed_emails, meeting_requests)
+    save_email_stats(email_stats)
+    
+    payload = {
+        'emails': all_processed_emails,
+        'meeting_requests': meeting_requests,
+        'meeting_count': email_stats['meeting_requests'],
+        'scheduled_meetings_count': get_scheduled_meetings_count(),
+        'real_emails_count': len(raw_emails),
+        'simulated_emails_count': len(simulated_meeting_emails)
+    }
+    cache[batch_size] = payload
+    return payload
+
 # ===== UTILITY FUNCTIONS =====
+# Email fields the dashboards render; /api/emails?fields=preview returns only these
+EMAIL_PREVIEW_FIELDS = (
+    'id', 'subject', 'sender', 'date', 'snippet', 'ai_urgency', 'ai_category',
+    'action_required', 'confidence', 'ai_reason', 'ai_summary', 'is_meeting_request'
+)
+
+def project_emails(emails, fields):
+    """Copy only the given fields of each email"""
+    return [{field: email[field] for field in fields if field in email} for email in emails]
+
+def to_rfc3339_utc(dt):
+    """Format an aware UTC datetime as an RFC 3339 string with a Z suffix"""
+    return dt.isoformat().replace('+00:00', 'Z')
+
+# Weekday names accepted by the "next <weekday>" fast path
+WEEKDAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+NEXT_WEEKDAY_RE = re.compile(r'^next\s+(' + '|'.join(WEEKDAY_NAMES) + r')$')
+ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+US_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
+
+def parse_numeric_date(text):
+    """Parse YYYY-MM-DD or MM/DD/YYYY with strptime, falling back to dateparser"""
+    text = text.strip()
+    try:
+        if ISO_DATE_RE.match(text):
+            return datetime.strptime(text, '%Y-%m-%d')
+        if US_DATE_RE.match(text):
+            return datetime.strptime(text, '%m/%d/%Y')
+    except ValueError:
+        return None
+    return dateparser.parse(text)
+
+@functools.lru_cache(maxsize=1024)
+def parse_future_date_cached(text, minute):
+    """Run dateparser once per distinct input and minute"""
+    # Relative inputs ("in 2 hours") resolve against the clock, so results only live for the minute
+    return dateparser.parse(text, settings={'PREFER_DATES_FROM': 'future'})
+
+def parse_user_date(text):
+    """Parse a user-entered date, handling common forms without dateparser"""
+    text = text.strip().lower()
+    now = datetime.now()
+    if text == 'today':
+        return now
+    if text == 'tomorrow':
+        return now + timedelta(days=1)
+    if ISO_DATE_RE.match(text):
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    match = NEXT_WEEKDAY_RE.match(text)
+    if match:
+        days_ahead = (WEEKDAY_NAMES.index(match.group(1)) - now.weekday()) % 7 or 7
+        return now + timedelta(days=days_ahead)
+    return parse_future_date_cached(text, now.replace(second=0, microsecond=0))
+
 def get_missing_field_prompt(current_data):
     """Get the next missing field prompt"""
     missing = [field for field in REQUIRED_FIELDS if field not in current_data or not current_data[field]]
@@ -980,7 +1860,7 @@ def process_update_field_input(field, user_input, current_data):
         return True, "✅ Event name updated!"
         
     elif field == "new_date":
-        parsed = dateparser.parse(user_input, settings={'PREFER_DATES_FROM': 'future'})
+        parsed = parse_user_date(user_input)
         if parsed and parsed.date() >= datetime.now().date():
             current_data[field] = parsed.strftime('%Y-%m-%d')
             return True, "✅ New date saved!"
@@ -998,30 +1878,30 @@ def process_update_field_input(field, user_input, current_data):
     
     return False, "⚠️ Invalid input for this field."
 
+# Phrases that explicitly ask for email processing
+EMAIL_INTENT_KEYWORDS = [
+    'check emails', 'show emails', 'process emails', 'email dashboard', 
+    'my emails', 'recent emails', 'inbox messages', 'check my inbox',
+    'show my inbox', 'process my emails', 'fetch emails', 'get emails'
+]
+EMAIL_INTENT_RE = re.compile('|'.join(re.escape(keyword) for keyword in EMAIL_INTENT_KEYWORDS))
+# Batch-size hints in an email request ("all my emails", "show 50 emails")
+ALL_EMAILS_RE = re.compile(r'all (?:my )?emails')
+BATCH_NUMBER_RE = re.compile(r'\b(\d+)\b')
+VALID_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+@functools.lru_cache(maxsize=2048)
 def is_email_processing_intent(message):
     """Detect if message is about email processing - only when explicitly requested"""
-    email_keywords = [
-        'check emails', 'show emails', 'process emails', 'email dashboard', 
-        'my emails', 'recent emails', 'inbox messages', 'check my inbox',
-        'show my inbox', 'process my emails', 'fetch emails', 'get emails'
-    ]
-    message_lower = message.lower().strip()
-    
-    # Check for explicit email processing requests
-    for keyword in email_keywords:
-        if keyword in message_lower:
-            return True
-
-    # Don't trigger on email addresses
-    if re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', message_lower):
-        return False
-    return False
+    # A bare email address never contains one of the phrases, so one scan is enough
+    return EMAIL_INTENT_RE.search(message.lower()) is not None
 
 # Email validation function
+@functools.lru_cache(maxsize=1024)
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # fullmatch, unlike match with $, also rejects a trailing newline
+    return VALID_EMAIL_RE.fullmatch(email) is not None
 
 # Initialize AI chat with error handling
 def initialize_chat():
@@ -1076,16 +1956,10 @@ def get_processed_emails():
 
         print(f"📧 Starting email fetch and processing with batch size: {batch_size}...")
         
-        # Fetch recent emails with specified batch size
-        raw_emails = fetch_recent_emails(services['gmail'], max_results=batch_size)
-        
-        # Add simulated meeting emails to show scheduled meetings
-        simulated_meeting_emails = simulate_meeting_emails()
+        # Fetch and process recent emails together with simulated meeting emails
+        payload = assemble_email_payload(batch_size)
         
-        # Combine real emails with simulated meeting emails
-        all_emails = simulated_meeting_emails + raw_emails
-        
-        if not all_emails:
+        if not payload:
             return jsonify({
                 'success': True,
                 'emails': [],
@@ -1097,34 +1971,25 @@ def get_processed_emails():
                 'message': 'No emails found'
             })
         
-        print(f"📧 Processing {len(raw_emails)} real emails + {len(simulated_meeting_emails)} simulated emails")
-        
-        # Process with AI (only process real emails, simulated ones are already processed)
-        processed_real_emails, meeting_requests = process_emails_with_ai(raw_emails)
-        
-        # Combine processed real emails with simulated emails
-        all_processed_emails = simulated_meeting_emails + processed_real_emails
-        
-        # Store in session for later use
-        session['processed_emails'] = all_processed_emails
-        session['meeting_requests'] = meeting_requests
-        
-        # Count different types
-        scheduled_meetings_count = get_scheduled_meetings_count()
-        meeting_count = len([e for e in all_processed_emails if e.get('is_meeting_request', False)])
+        all_processed_emails = payload['emails']
+        print(f"✅ Email processing complete: {len(all_processed_emails)} total, {payload['meeting_count']} meetings, {payload['scheduled_meetings_count']} scheduled")
         
-        print(f"✅ Email processing complete: {len(all_processed_emails)} total, {meeting_count} meetings, {scheduled_meetings_count} scheduled")
+        # Bodies and bookkeeping fields are only sent when the client asks for them
+        if request.args.get('fields') == 'preview':
+            response_emails = project_emails(all_processed_emails, EMAIL_PREVIEW_FIELDS)
+        else:
+            response_emails = all_processed_emails
         
         return jsonify({
             'success': True,
-            'emails': all_processed_emails,
-            'meeting_requests': meeting_requests,
+            'emails': response_emails,
+            'meeting_requests': payload['meeting_requests'],
             'total_count': len(all_processed_emails),
-            'meeting_count': meeting_count,
-            'scheduled_meetings_count': scheduled_meetings_count,
+            'meeting_count': payload['meeting_count'],
+            'scheduled_meetings_count': payload['scheduled_meetings_count'],
             'batch_size': batch_size,
-            'real_emails_count': len(raw_emails),
-            'simulated_emails_count': len(simulated_meeting_emails)
+            'real_emails_count': payload['real_emails_count'],
+            'simulated_emails_count': payload['simulated_emails_count']
         })
         
     except Exception as error:
@@ -1187,6 +2052,303 @@ def email_config():
                 'error': str(error)
             }), 400
 
+# ===== CHAT INTENT HANDLERS =====
+def handle_schedule_intent(user_input, data, waiting_for):
+    """Collect scheduling details turn by turn, then create the meeting"""
+    # Handle user input for the waiting_for field
+    if waiting_for:
+        field = waiting_for
+        if field == "participant_email" and validate_email(user_input):
+            data[field] = user_input
+        elif field == "event_name" and user_input:
+            data[field] = user_input
+        elif field == "event_date":
+            parsed = parse_user_date(user_input)
+            if parsed and parsed.date() >= datetime.now().date():
+                data[field] = parsed.strftime('%Y-%m-%d')
+            else:
+                return jsonify({"reply": "⚠️ Please enter a valid future date."})
+        elif field == "event_time":
+            extracted_time = extract_event_details(user_input).get('event_time')
+            if extracted_time:
+                data[field] = extracted_time
+            else:
+                return jsonify({"reply": "⚠️ Please enter a valid time (e.g., '2 PM', '10 AM to 11 AM')."})
+        
+        session['data'] = data
+        session.pop('waiting_for', None)
+        session.modified = True
+    
+    # Check for missing fields and prompt for them
+    field, prompt = get_missing_field_prompt(data)
+    if field:
+        session['waiting_for'] = field
+        session.modified = True
+        logger.debug("Missing field: %s, prompting user", field)
+        return jsonify({"reply": prompt})
+
+    # All fields are present, proceed with scheduling
+    details = data
+    logger.debug("All fields present, proceeding with scheduling: %s", details)
+    
+    # Validate services
+    if not services or 'gmail' not in services or 'calendar' not in services:
+        session.clear()
+        return jsonify({"reply": "❌ Calendar or Gmail service not available. Please check authentication."})
+    
+    # Validate participant email
+    if not validate_email(details['participant_email']):
+        session.clear()
+        return jsonify({"reply": "❌ Invalid participant email address."})
+    
+    try:
+        start_time, end_time = parse_datetime(details['event_date'], details['event_time'])
+        
+        # Check for conflicts first
+        has_conflict = check_participant_calendar_conflicts(
+            services['calendar'],
+            details['participant_email'],
+            start_time,
+            end_time
+        )
+        
+        if has_conflict:
+            send_conflict_notification(
+                services['gmail'],
+                details['participant_email'],
+                details['event_name'],
+                start_time,
+                end_time
+            )
+            msg = f"⚠️ Participant '{details['participant_email']}' has a scheduling conflict at the requested time. They have been notified about the conflict."
+        else:
+            # Create event with meeting link and let Google Calendar send the invite
+            event_created, actual_meeting_link = create_event_with_meeting_link(
+                services['calendar'],
+                summary=details['event_name'],
+                start_time=start_time,
+                end_time=end_time,
+                participant_email=details['participant_email']
+            )
+            
+            if event_created:
+                # Track the scheduled meeting
+                track_scheduled_meeting(
+                    details['participant_email'],
+                    details['event_name'],
+                    details['event_date'],
+                    details['event_time'],
+                    actual_meeting_link,
+                    event_created.get('id')
+                )
+                
+                msg = f"✅ Event '{details['event_name']}' scheduled successfully with {details['participant_email']}!\n\n🔗 Meeting Link: {actual_meeting_link}\n\n📧 A calendar invitation has been sent with meeting details.\n\n📊 Meeting count updated in email dashboard: {get_scheduled_meetings_count()} total scheduled meetings."
+            else:
+                msg = f"❌ Failed to create calendar event. Please check your calendar permissions."
+
+    except Exception as e:
+        logger.error("Error in scheduling: %s", e)
+        msg = f"❌ Error scheduling meeting: {str(e)}"
+
+    session.clear()
+    return jsonify({"reply": msg})
+
+def handle_update_intent(user_input, data, waiting_for):
+    """Collect the new date and time, then reschedule the event"""
+    # Handle user input for the waiting_for field
+    if waiting_for:
+        field = waiting_for
+        success, message = process_update_field_input(field, user_input, data)
+        
+        if success:
+            session.pop('waiting_for', None)
+            session.modified = True
+        else:
+            return jsonify({"reply": message})
+    
+    # Check for missing fields and prompt for them
+    field, prompt = get_missing_update_field_prompt(data)
+    if field:
+        session['waiting_for'] = field
+        session.modified = True
+        logger.debug("Missing update field: %s, prompting user", field)
+        return jsonify({"reply": prompt})
+
+    # All fields are present, proceed with ENHANCED update
+    details = data
+    logger.debug("All update fields present, proceeding with enhanced update: %s", details)
+    
+    if not services or 'calendar' not in services or 'gmail' not in services:
+        session.clear()
+        return jsonify({"reply": "❌ Services not available. Please check authentication."})
+
+    try:
+        # Use the enhanced update function
+        success, message = update_event_with_sync(
+            services['calendar'],
+            services['gmail'],
+            details['event_name'],
+            details['new_date'],
+            details['new_time']
+        )
+        
+        if success:
+            # update/delete_event_with_sync already updated the session copy
+            # Add meeting count info
+            meeting_count = get_scheduled_meetings_count()
+            enhanced_message = f"{message}\n\n📊 Calendar synchronized. Total scheduled meetings: {meeting_count}"
+            
+            session.clear()
+            return jsonify({"reply": enhanced_message})
+        else:
+            session.clear()
+            return jsonify({"reply": f"❌ {message}"})
+                
+    except Exception as e:
+        logger.error("Error in enhanced update: %s", e)
+        session.clear()
+        return jsonify({"reply": f"❌ Error updating meeting: {str(e)}"})
+
+def handle_delete_intent(user_input, data, waiting_for):
+    """Pick the event to delete, then delete it and notify attendees"""
+    details = data
+    
+    # Handle waiting for event name input
+    if waiting_for == 'event_name':
+        event_name = user_input.strip()
+        if event_name:
+            details['event_name'] = event_name
+            session['data'] = details
+            session.pop('waiting_for', None)
+            session.modified = True
+        else:
+            return jsonify({"reply": "⚠️ Please enter a valid event name."})
+    
+    # Check if we still need event name with enhanced event listing
+    if 'event_name' not in details or not details['event_name']:
+        try:
+            if services and 'calendar' in services:
+                # Get recent events from calendar with better filtering
+                user_email = get_authenticated_user_email()
+                events = list_delete_candidate_events(services['calendar'], user_email)
+                
+                # Filter deletable events more accurately
+                user_email_lower = (user_email or '').lower()
+                deletable_events = []
+                for event in events:
+                    organizer = event.get('organizer', {})
+                    creator = event.get('creator', {})
+                    
+                    # Check if user is organizer or creator
+                    is_user_organizer = bool(user_email_lower) and (
+                        organizer.get('email', '').lower() == user_email_lower or
+                        creator.get('email', '').lower() == user_email_lower
+                    )
+                    
+                    if is_user_organizer and event.get('summary'):
+                        start_time = event.get('start', {})
+                        start_str = start_time.get('dateTime', start_time.get('date', ''))
+                        
+                        # Format date nicely
+                        if start_str:
+                            if 'T' in start_str:
+                                parsed_start = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
+                                formatted_date = parsed_start.strftime('%b %d, %Y at %I:%M %p')
+                            else:
+                                formatted_date = start_str
+                        else:
+                            formatted_date = 'Date unknown'
+                        
+                        deletable_events.append({
+                            'name': event['summary'],
+                            'formatted_date': formatted_date,
+                            'id': event['id'],
+                            'has_attendees': len(event.get('attendees', [])) > 1
+                        })
+                
+                if deletable_events:
+                    event_lines = ["📅 **Your Deletable Events:**\n\n"]
+                    event_lines.extend(
+                        f"{i+1}. **{event['name']}**{' 👥' if event['has_attendees'] else ''}\n   📅 {event['formatted_date']}\n\n"
+                        for i, event in enumerate(deletable_events[:8])  # Show max 8
+                    )
+                    event_lines.append("💡 Events with 👥 have attendees who will be notified.\n")
+                    event_lines.append("Enter the **event name** or **number** to delete:")
+                    event_list = "".join(event_lines)
+                    
+                    session['waiting_for'] = 'event_name'
+                    session['deletable_events'] = deletable_events  # Store for number selection
+                    session.modified = True
+                    
+                    return jsonify({
+                        "reply": event_list
+                    })
+                else:
+                    session.clear()
+                    return jsonify({"reply": "📅 No deletable events found in your calendar (you must be the organizer to delete events)."})
+                    
+        except Exception as e:
+            print(f"Error fetching events: {e}")
+        
+        # Fallback
+        session['waiting_for'] = 'event_name'
+        session.modified = True
+        return jsonify({"reply": "🗑️ What is the name of the event you want to delete?"})
+
+    # Handle number selection for events
+    if user_input.isdigit() and 'deletable_events' in session:
+        try:
+            event_index = int(user_input) - 1
+            deletable_events = session.get('deletable_events', [])
+            if 0 <= event_index < len(deletable_events):
+                selected_event = deletable_events[event_index]
+                details['event_name'] = selected_event['name']
+                session['data'] = details
+                session.pop('deletable_events', None)
+                session.modified = True
+                logger.debug("Selected event by number: %s", selected_event['name'])
+            else:
+                return jsonify({"reply": "⚠️ Invalid event number. Please try again."})
+        except ValueError:
+            pass  # Not a number, continue with regular processing
+
+    # Proceed with ENHANCED deletion
+    if not services or 'calendar' not in services or 'gmail' not in services:
+        session.clear()
+        return jsonify({"reply": "❌ Services not available. Please check authentication."})
+
+    try:
+        # Use the enhanced delete function
+        success, message = delete_event_with_sync(
+            services['calendar'],
+            services['gmail'],
+            details['event_name']
+        )
+        
+        if success:
+            # update/delete_event_with_sync already updated the session copy
+            # Add meeting count info
+            meeting_count = get_scheduled_meetings_count()
+            enhanced_message = f"{message}\n\n📊 Calendar synchronized. Total scheduled meetings: {meeting_count}"
+            
+            session.clear()
+            return jsonify({"reply": enhanced_message})
+        else:
+            session.clear()
+            return jsonify({"reply": f"❌ {message}"})
+            
+    except Exception as e:
+        logger.error("Error in enhanced delete: %s", e)
+        session.clear()
+        return jsonify({"reply": f"❌ Error deleting event: {str(e)}"})
+
+# Chat flows keyed by the intent stored in the session
+INTENT_HANDLERS = {
+    'schedule': handle_schedule_intent,
+    'update': handle_update_intent,
+    'delete': handle_delete_intent
+}
+
 @app.route('/chat', methods=['POST'])
 def chat_route():
     """Enhanced chat route with FIXED meeting scheduling and update flow"""
@@ -1198,20 +2360,15 @@ def chat_route():
             
         user_input = correct_schedule_spelling(user_input)
 
-        if 'data' not in session:
-            session['data'] = {}
-        data = session['data']
-
-        if 'messages' not in session:
-            session['messages'] = []
+        user_input_lower = user_input.lower()
+        data = session.setdefault('data', {})
+        intent = session.get('intent')
+        waiting_for = session.get('waiting_for')
         
-        print(f"DEBUG - User input: '{user_input}'")
-        print(f"DEBUG - Current session intent: {session.get('intent')}")
-        print(f"DEBUG - Current data: {session.get('data', {})}")
-        print(f"DEBUG - Waiting for: {session.get('waiting_for')}")
+        logger.debug("User input: %r, intent: %s, data: %s, waiting for: %s", user_input, intent, data, waiting_for)
 
         # Check if user is asking about emails (only explicit requests)
-        if is_email_processing_intent(user_input) and 'intent' not in session:
+        if intent is None and is_email_processing_intent(user_input):
             try:
                 if not services or 'gmail' not in services:
                     return jsonify({
@@ -1219,37 +2376,31 @@ def chat_route():
                     })
 
                 # Get batch size from user input if specified
+                max_batch_size = EMAIL_CONFIG['max_batch_size']
                 batch_size = EMAIL_CONFIG['default_batch_size']
-                if 'all emails' in user_input.lower() or 'all my emails' in user_input.lower():
-                    batch_size = EMAIL_CONFIG['max_batch_size']
-                elif any(num in user_input for num in ['50', '100', '200']):
-                    # Extract number if user specifies
-                    numbers = re.findall(r'\b(\d+)\b', user_input)
-                    if numbers:
-                        batch_size = min(int(numbers[0]), EMAIL_CONFIG['max_batch_size'])
-
-                raw_emails = fetch_recent_emails(services['gmail'], max_results=batch_size)
-                simulated_meeting_emails = simulate_meeting_emails()
-                all_emails = simulated_meeting_emails + raw_emails
+                if ALL_EMAILS_RE.search(user_input_lower):
+                    batch_size = max_batch_size
+                else:
+                    # Use the first number the user gives, if any
+                    number_match = BATCH_NUMBER_RE.search(user_input)
+                    if number_match:
+                        batch_size = min(max(int(number_match.group(1)), 1), max_batch_size)
+
+                payload = assemble_email_payload(batch_size)
                 
-                if not all_emails:
+                if not payload:
                     return jsonify({
                         'reply': '📧 No emails found in your inbox.'
                     })
                 
-                processed_real_emails, meeting_requests = process_emails_with_ai(raw_emails)
-                all_processed_emails = simulated_meeting_emails + processed_real_emails
-                
-                session['processed_emails'] = all_processed_emails
-                session['meeting_requests'] = meeting_requests
-                
-                high_priority = len([e for e in all_processed_emails if e.get('ai_urgency') == 'high'])
-                action_required = len([e for e in all_processed_emails if e.get('action_required')])
-                meeting_count = len([e for e in all_processed_emails if e.get('is_meeting_request', False)])
-                scheduled_count = get_scheduled_meetings_count()
+                all_processed_emails = payload['emails']
+                meeting_requests = payload['meeting_requests']
+                scheduled_count = payload['scheduled_meetings_count']
+                high_priority = sum(1 for e in all_processed_emails if e.get('ai_urgency') == 'high')
+                action_required = sum(1 for e in all_processed_emails if e.get('action_required'))
                 
                 summary_msg = f"📧 **Email Summary (Batch: {len(all_processed_emails)}):**\n"
-                summary_msg += f"• Total emails: {len(all_processed_emails)} ({len(raw_emails)} real + {len(simulated_meeting_emails)} scheduled)\n"
+                summary_msg += f"• Total emails: {len(all_processed_emails)} ({payload['real_emails_count']} real + {payload['simulated_emails_count']} scheduled)\n"
                 summary_msg += f"• High priority: {high_priority}\n"
                 summary_msg += f"• Action required: {action_required}\n"
                 summary_msg += f"• Meeting requests: {len(meeting_requests)}\n"
@@ -1278,33 +2429,33 @@ def chat_route():
                 return jsonify({"reply": f"❌ Error processing emails: {str(error)}"})
 
         # Initial intent detection (only if no current intent)
-        if 'intent' not in session:
+        if intent is None:
             if is_schedule_intent(user_input):
-                session['intent'] = 'schedule'
+                intent = session['intent'] = 'schedule'
                 extracted = extract_event_details(user_input)
-                session['data'] = extracted
+                data = session['data'] = extracted
                 session.modified = True
-                print(f"DEBUG - Schedule intent detected, extracted data: {extracted}")
+                logger.debug("Schedule intent detected, extracted data: %s", extracted)
             elif is_update_intent(user_input):
-                session['intent'] = 'update'
+                intent = session['intent'] = 'update'
                 session['update_text'] = user_input
                 extracted = extract_update_details(user_input)
                 # Map the fields correctly for the update flow
-                session['data'] = {
+                data = session['data'] = {
                     'event_name': extracted.get('event_name'),
                     'new_date': extracted.get('event_date'),  # Map event_date to new_date
                     'new_time': extracted.get('event_time')   # Map event_time to new_time
                 }
                 session.modified = True
-                print(f"DEBUG - Update intent detected, mapped data: {session['data']}")
+                logger.debug("Update intent detected, mapped data: %s", data)
             elif is_delete_intent(user_input):
-                session['intent'] = 'delete'
+                intent = session['intent'] = 'delete'
                 session['delete_text'] = user_input
-                session['data'] = extract_delete_details(user_input)
+                data = session['data'] = extract_delete_details(user_input)
                 session.modified = True
             else:
                 # Handle meeting request processing confirmation
-                if "yes" in user_input.lower() and session.get('meeting_requests'):
+                if "yes" in user_input_lower and load_session_list('meeting_requests'):
                     return process_meeting_requests_from_chat()
                 
                 # Default AI response with fallback
@@ -1321,321 +2472,22 @@ def chat_route():
                             'bye': "Goodbye! Feel free to return whenever you need help with your calendar or emails."
                         }
                         
-                        user_lower = user_input.lower()
                         for key, response in fallback_responses.items():
-                            if key in user_lower:
+                            if key in user_input_lower:
                                 return jsonify({"reply": response})
                         
                         return jsonify({"reply": "I can help you schedule meetings, update events, delete appointments, or check your emails. Please let me know what you'd like to do, or say 'help' for more information."})
                         
                 except Exception as e:
-                    return jsonify({"reply": "I can help you schedule meetings, update events, delete appointments, or check your emails. Please let me know what you'd like to do!"})
-
-        intent = session['intent']
-        print(f"DEBUG - Processing intent: {intent}")
-
-        # ===== FIXED SCHEDULE FLOW =====
-        if intent == 'schedule':
-            # Handle user input for the waiting_for field
-            if 'waiting_for' in session:
-                field = session['waiting_for']
-                if field == "participant_email" and validate_email(user_input):
-                    data[field] = user_input
-                elif field == "event_name" and user_input:
-                    data[field] = user_input
-                elif field == "event_date":
-                    parsed = dateparser.parse(user_input, settings={'PREFER_DATES_FROM': 'future'})
-                    if parsed and parsed.date() >= datetime.now().date():
-                        data[field] = parsed.strftime('%Y-%m-%d')
-                    else:
-                        return jsonify({"reply": "⚠️ Please enter a valid future date."})
-                elif field == "event_time":
-                    extracted_time = extract_event_details(user_input).get('event_time')
-                    if extracted_time:
-                        data[field] = extracted_time
-                    else:
-                        return jsonify({"reply": "⚠️ Please enter a valid time (e.g., '2 PM', '10 AM to 11 AM')."})
-                
-                session['data'] = data
-                session.pop('waiting_for', None)
-                session.modified = True
-            
-            # Check for missing fields and prompt for them
-            field, prompt = get_missing_field_prompt(session['data'])
-            if field:
-                session['waiting_for'] = field
-                session.modified = True
-                print(f"DEBUG - Missing field: {field}, prompting user")
-                return jsonify({"reply": prompt})
-
-            # All fields are present, proceed with scheduling
-            details = session['data']
-            print(f"DEBUG - All fields present, proceeding with scheduling: {details}")
-            
-            # Validate services
-            if not services or 'gmail' not in services or 'calendar' not in services:
-                session.clear()
-                return jsonify({"reply": "❌ Calendar or Gmail service not available. Please check authentication."})
-            
-            # Validate participant email
-            if not validate_email(details['participant_email']):
-                session.clear()
-                return jsonify({"reply": "❌ Invalid participant email address."})
-            
-            try:
-                start_time, end_time = parse_datetime(details['event_date'], details['event_time'])
-                
-                # Check for conflicts first
-                has_conflict = check_participant_calendar_conflicts(
-                    services['calendar'],
-                    details['participant_email'],
-                    start_time,
-                    end_time
-                )
-                
-                if has_conflict:
-                    send_conflict_notification(
-                        services['gmail'],
-                        details['participant_email'],
-                        details['event_name'],
-                        start_time,
-                        end_time
-                    )
-                    msg = f"⚠️ Participant '{details['participant_email']}' has a scheduling conflict at the requested time. They have been notified about the conflict."
-                else:
-                    # Create event with meeting link and let Google Calendar send the invite
-                    event_created, actual_meeting_link = create_event_with_meeting_link(
-                        services['calendar'],
-                        summary=details['event_name'],
-                        start_time=start_time,
-                        end_time=end_time,
-                        participant_email=details['participant_email']
-                    )
-                    
-                    if event_created:
-                        # Track the scheduled meeting
-                        track_scheduled_meeting(
-                            details['participant_email'],
-                            details['event_name'],
-                            details['event_date'],
-                            details['event_time'],
-                            actual_meeting_link,
-                            event_created.get('id')
-                        )
-                        
-                        msg = f"✅ Event '{details['event_name']}' scheduled successfully with {details['participant_email']}!\n\n🔗 Meeting Link: {actual_meeting_link}\n\n📧 A calendar invitation has been sent with meeting details.\n\n📊 Meeting count updated in email dashboard: {get_scheduled_meetings_count()} total scheduled meetings."
-                    else:
-                        msg = f"❌ Failed to create calendar event. Please check your calendar permissions."
-
-            except Exception as e:
-                print(f"DEBUG - Error in scheduling: {e}")
-                msg = f"❌ Error scheduling meeting: {str(e)}"
-
-            session.clear()
-            return jsonify({"reply": msg})
-
-        elif intent == 'update':
-            # Handle user input for the waiting_for field
-            if 'waiting_for' in session:
-                field = session['waiting_for']
-                success, message = process_update_field_input(field, user_input, session['data'])
-                
-                if success:
-                    session.pop('waiting_for', None)
-                    session.modified = True
-                else:
-                    return jsonify({"reply": message})
-            
-            # Check for missing fields and prompt for them
-            field, prompt = get_missing_update_field_prompt(session['data'])
-            if field:
-                session['waiting_for'] = field
-                session.modified = True
-                print(f"DEBUG - Missing update field: {field}, prompting user")
-                return jsonify({"reply": prompt})
-
-            # All fields are present, proceed with ENHANCED update
-            details = session['data']
-            print(f"DEBUG - All update fields present, proceeding with enhanced update: {details}")
-            
-            if not services or 'calendar' not in services or 'gmail' not in services:
-                session.clear()
-                return jsonify({"reply": "❌ Services not available. Please check authentication."})
-
-            try:
-                # Use the enhanced update function
-                success, message = update_event_with_sync(
-                    services['calendar'],
-                    services['gmail'],
-                    details['event_name'],
-                    details['new_date'],
-                    details['new_time']
-                )
-                
-                if success:
-                    # Sync session data with calendar
-                    sync_session_with_calendar(services['calendar'])
-                    
-                    # Add meeting count info
-                    meeting_count = get_scheduled_meetings_count()
-                    enhanced_message = f"{message}\n\n📊 Calendar synchronized. Total scheduled meetings: {meeting_count}"
-                    
-                    session.clear()
-                    return jsonify({"reply": enhanced_message})
-                else:
-                    session.clear()
-                    return jsonify({"reply": f"❌ {message}"})
-                        
-            except Exception as e:
-                print(f"DEBUG - Error in enhanced update: {e}")
-                session.clear()
-                return jsonify({"reply": f"❌ Error updating meeting: {str(e)}"})
-
-        # ===== ENHANCED DELETE FLOW =====
-        elif intent == 'delete':
-            details = session['data']
-            
-            # Handle waiting for event name input
-            if 'waiting_for' in session and session['waiting_for'] == 'event_name':
-                event_name = user_input.strip()
-                if event_name:
-                    details['event_name'] = event_name
-                    session['data'] = details
-                    session.pop('waiting_for', None)
-                    session.modified = True
-                else:
-                    return jsonify({"reply": "⚠️ Please enter a valid event name."})
-            
-            # Check if we still need event name with enhanced event listing
-            if 'event_name' not in details or not details['event_name']:
-                try:
-                    if services and 'calendar' in services:
-                        # Get recent events from calendar with better filtering
-                        now = datetime.utcnow()
-                        time_min = (now - timedelta(days=1)).isoformat() + 'Z'
-                        time_max = (now + timedelta(days=30)).isoformat() + 'Z'
-                        
-                        events_result = services['calendar'].events().list(
-                            calendarId='primary',
-                            timeMin=time_min,
-                            timeMax=time_max,
-                            maxResults=20,  # Increased to show more options
-                            singleEvents=True,
-                            orderBy='startTime'
-                        ).execute()
-                        
-                        events = events_result.get('items', [])
-                        user_email = get_authenticated_user_email()
-                        
-                        # Filter deletable events more accurately
-                        deletable_events = []
-                        for event in events:
-                            organizer = event.get('organizer', {})
-                            creator = event.get('creator', {})
-                            
-                            # Check if user is organizer or creator
-                            is_user_organizer = (
-                                organizer.get('email', '').lower() == user_email.lower() if user_email else False or
-                                creator.get('email', '').lower() == user_email.lower() if user_email else False
-                            )
-                            
-                            if is_user_organizer and event.get('summary'):
-                                start_time = event.get('start', {})
-                                start_str = start_time.get('dateTime', start_time.get('date', ''))
-                                
-                                # Format date nicely
-                                if start_str:
-                                    if 'T' in start_str:
-                                        parsed_start = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-                                        formatted_date = parsed_start.strftime('%b %d, %Y at %I:%M %p')
-                                    else:
-                                        formatted_date = start_str
-                                else:
-                                    formatted_date = 'Date unknown'
-                                
-                                deletable_events.append({
-                                    'name': event['summary'],
-                                    'formatted_date': formatted_date,
-                                    'id': event['id'],
-                                    'has_attendees': len(event.get('attendees', [])) > 1
-                                })
-                        
-                        if deletable_events:
-                            event_list = "📅 **Your Deletable Events:**\n\n"
-                            for i, event in enumerate(deletable_events[:8]):  # Show max 8
-                                attendee_note = " 👥" if event['has_attendees'] else ""
-                                event_list += f"{i+1}. **{event['name']}**{attendee_note}\n   📅 {event['formatted_date']}\n\n"
-                            
-                            event_list += "💡 Events with 👥 have attendees who will be notified.\n"
-                            event_list += "Enter the **event name** or **number** to delete:"
-                            
-                            session['waiting_for'] = 'event_name'
-                            session['deletable_events'] = deletable_events  # Store for number selection
-                            session.modified = True
-                            
-                            return jsonify({
-                                "reply": event_list
-                            })
-                        else:
-                            session.clear()
-                            return jsonify({"reply": "📅 No deletable events found in your calendar (you must be the organizer to delete events)."})
-                            
-                except Exception as e:
-                    print(f"Error fetching events: {e}")
-                
-                # Fallback
-                session['waiting_for'] = 'event_name'
-                session.modified = True
-                return jsonify({"reply": "🗑️ What is the name of the event you want to delete?"})
-
-            # Handle number selection for events
-            if user_input.isdigit() and 'deletable_events' in session:
-                try:
-                    event_index = int(user_input) - 1
-                    deletable_events = session.get('deletable_events', [])
-                    if 0 <= event_index < len(deletable_events):
-                        selected_event = deletable_events[event_index]
-                        details['event_name'] = selected_event['name']
-                        session['data'] = details
-                        session.pop('deletable_events', None)
-                        session.modified = True
-                        print(f"DEBUG - Selected event by number: {selected_event['name']}")
-                    else:
-                        return jsonify({"reply": "⚠️ Invalid event number. Please try again."})
-                except ValueError:
-                    pass  # Not a number, continue with regular processing
+                    return jsonify({"reply": "I can help you schedule meetings, update events, delete appointments, or check your emails. Please let me know what you'd like to do!"})
 
-            # Proceed with ENHANCED deletion
-            if not services or 'calendar' not in services or 'gmail' not in services:
-                session.clear()
-                return jsonify({"reply": "❌ Services not available. Please check authentication."})
+        logger.debug("Processing intent: %s", intent)
 
-            try:
-                # Use the enhanced delete function
-                success, message = delete_event_with_sync(
-                    services['calendar'],
-                    services['gmail'],
-                    details['event_name']
-                )
-                
-                if success:
-                    # Sync session data with calendar
-                    sync_session_with_calendar(services['calendar'])
-                    
-                    # Add meeting count info
-                    meeting_count = get_scheduled_meetings_count()
-                    enhanced_message = f"{message}\n\n📊 Calendar synchronized. Total scheduled meetings: {meeting_count}"
-                    
-                    session.clear()
-                    return jsonify({"reply": enhanced_message})
-                else:
-                    session.clear()
-                    return jsonify({"reply": f"❌ {message}"})
-                    
-            except Exception as e:
-                print(f"DEBUG - Error in enhanced delete: {e}")
-                session.clear()
-                return jsonify({"reply": f"❌ Error deleting event: {str(e)}"})
+        handler = INTENT_HANDLERS.get(intent)
+        if handler:
+            response = handler(user_input, data, waiting_for)
+            if response is not None:
+                return response
 
         return jsonify({"reply": "I didn't understand that request. Please try scheduling a meeting, updating an event, deleting an event, or checking your emails."})
 
@@ -1652,8 +2504,7 @@ def cancel_meeting_enhanced(meeting_id):
     """Enhanced cancel meeting with proper calendar sync"""
     try:
         # Get meeting details
-        all_meetings = get_all_scheduled_meetings()
-        meeting = next((m for m in all_meetings if m['id'] == meeting_id), None)
+        meeting = get_scheduled_meeting(meeting_id)
         
         if not meeting:
             return jsonify({'success': False, 'error': 'Meeting not found'})
@@ -1670,9 +2521,7 @@ def cancel_meeting_enhanced(meeting_id):
             )
             
             if success:
-                # Sync session data
-                sync_session_with_calendar(services['calendar'])
-                
+                # delete_event_with_sync already cleaned up the session copy
                 return jsonify({
                     'success': True,
                     'message': message,
@@ -1684,30 +2533,20 @@ def cancel_meeting_enhanced(meeting_id):
             # Fallback to direct calendar deletion
             try:
                 if meeting.get('calendar_event_id'):
-                    # Send cancellation email first
-                    participant_emails = meeting.get('participant_emails', [])
-                    if not participant_emails and meeting.get('participant_email'):
-                        participant_emails = [meeting['participant_email']]
-                    
-                    for email in participant_emails:
-                        send_meeting_cancellation_email(
-                            services['gmail'],
-                            email,
-                            meeting.get('event_name', 'Meeting'),
-                            "Meeting cancelled via AI Calendar System"
-                        )
-                    
-                    # Delete from calendar
+                    # Delete from calendar; sendUpdates='all' notifies the participants
                     services['calendar'].events().delete(
                         calendarId='primary',
                         eventId=meeting['calendar_event_id'],
                         sendUpdates='all'
                     ).execute()
+                    invalidate_scheduled_meetings()
                     
                     print(f"✅ Deleted calendar event: {meeting['calendar_event_id']}")
                     
-                    # Sync session data
-                    sync_session_with_calendar(services['calendar'])
+                    # Drop only the session records for the deleted event
+                    remove_session_meetings([
+                        m['id'] for m in session_meetings_for_event(meeting['calendar_event_id'])
+                    ])
                     
                     return jsonify({
                         'success': True,
@@ -1725,6 +2564,59 @@ def cancel_meeting_enhanced(meeting_id):
         print(f"❌ Error in cancel_meeting_enhanced: {error}")
         return jsonify({'success': False, 'error': str(error)})
 
+@app.route('/api/meetings/cancel', methods=['POST'])
+def cancel_meetings_bulk():
+    """Cancel several meetings, deleting their calendar events in batched requests"""
+    try:
+        meeting_ids = (request.get_json(silent=True) or {}).get('meeting_ids')
+        if (not isinstance(meeting_ids, list) or not meeting_ids
+                or not all(isinstance(meeting_id, str) and meeting_id for meeting_id in meeting_ids)):
+            return jsonify({'success': False, 'error': 'meeting_ids must be a non-empty list of meeting ids'}), 400
+        if len(meeting_ids) > BULK_CANCEL_MAX_MEETINGS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {BULK_CANCEL_MAX_MEETINGS} meetings can be cancelled at once'
+            }), 400
+        
+        if not services or 'calendar' not in services:
+            return jsonify({'success': False, 'error': 'Services not available'})
+        
+        meetings = {meeting_id: get_scheduled_meeting(meeting_id) for meeting_id in meeting_ids}
+        results = delete_calendar_events_batch(
+            services['calendar'],
+            [m['calendar_event_id'] for m in meetings.values() if m and m.get('calendar_event_id')]
+        )
+        
+        cancelled, failed = [], []
+        for meeting_id, meeting in meetings.items():
+            if not meeting:
+                failed.append({'id': meeting_id, 'error': 'Meeting not found'})
+                continue
+            event_id = meeting.get('calendar_event_id')
+            success, message = results.get(event_id, (False, 'No calendar event ID found'))
+            if success:
+                cancelled.append(meeting_id)
+            else:
+                failed.append({'id': meeting_id, 'error': message})
+        
+        # Drop the session records for every deleted event
+        deleted_event_ids = {event_id for event_id, (success, _) in results.items() if success}
+        remove_session_meetings([
+            m['id'] for event_id in deleted_event_ids for m in session_meetings_for_event(event_id)
+        ] + cancelled)
+        
+        print(f"✅ Cancelled {len(cancelled)} meetings, {len(failed)} failed")
+        return jsonify({
+            'success': bool(cancelled),
+            'cancelled': cancelled,
+            'failed': failed,
+            'total_meetings': get_scheduled_meetings_count()
+        })
+        
+    except Exception as error:
+        print(f"❌ Error in cancel_meetings_bulk: {error}")
+        return jsonify({'success': False, 'error': str(error)})
+
 # Additional utility functions for better calendar synchronization
 
 def refresh_calendar_data():
@@ -1736,6 +2628,7 @@ def refresh_calendar_data():
         print("🔄 Refreshing calendar data...")
         
         # Get fresh calendar meetings
+        invalidate_scheduled_meetings()
         calendar_meetings = get_scheduled_meetings_from_calendar()
         
         # Sync session data
@@ -1759,11 +2652,12 @@ def refresh_calendar_enhanced():
         success, message = refresh_calendar_data()
         
         if success:
+            scheduled_meetings = get_all_scheduled_meetings()
             return jsonify({
                 'success': True,
                 'message': message,
-                'scheduled_meetings': get_all_scheduled_meetings(),
-                'total_meetings': get_scheduled_meetings_count(),
+                'scheduled_meetings': scheduled_meetings,
+                'total_meetings': len(scheduled_meetings),
                 'last_refresh': session.get('last_calendar_refresh')
             })
         else:
@@ -1785,23 +2679,20 @@ def validate_calendar_sync():
             return False, "Calendar service not available"
         
         # Get session meetings
-        session_meetings = session.get('scheduled_meetings', [])
+        session_meetings = load_session_meetings()
         
         # Get calendar meetings
         calendar_meetings = get_scheduled_meetings_from_calendar()
         
         # Check for mismatches
         mismatches = []
+        calendar_event_ids = {cm['calendar_event_id'] for cm in calendar_meetings if cm.get('calendar_event_id')}
         
         for session_meeting in session_meetings:
             calendar_event_id = session_meeting.get('calendar_event_id')
             if calendar_event_id:
                 # Check if this event exists in calendar
-                calendar_match = next(
-                    (cm for cm in calendar_meetings if cm.get('calendar_event_id') == calendar_event_id),
-                    None
-                )
-                if not calendar_match:
+                if calendar_event_id not in calendar_event_ids:
                     mismatches.append(f"Session meeting '{session_meeting.get('event_name')}' not found in calendar")
         
         if mismatches:
@@ -1826,7 +2717,7 @@ def validate_calendar_sync_endpoint():
         return jsonify({
             'success': success,
             'message': message,
-            'session_meetings_count': len(session.get('scheduled_meetings', [])),
+            'session_meetings_count': len(load_session_meetings()),
             'calendar_meetings_count': len(get_scheduled_meetings_from_calendar()),
             'total_meetings_count': get_scheduled_meetings_count()
         })
@@ -1838,20 +2729,35 @@ def validate_calendar_sync_endpoint():
         }), 500
 
 # Enhanced error recovery for calendar operations
+# User-facing messages for Calendar HTTP statuses that cannot be recovered from
+CALENDAR_ERROR_MESSAGES = {
+    401: "Authentication expired. Please re-authenticate with Google Calendar",
+    403: "Permission denied. Check your Google Calendar permissions",
+    429: "Rate limit exceeded. Please try again in a few moments",
+    502: "Google Calendar service temporarily unavailable. Please try again later",
+    503: "Google Calendar service temporarily unavailable. Please try again later"
+}
+CALENDAR_STATUS_RE = re.compile(r'\b(401|403|404|429|502|503)\b')
+
+def calendar_error_status(error):
+    """Get the HTTP status of a Calendar API error"""
+    # HttpError carries the status on its response; other errors only mention it
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is not None:
+        return int(status)
+    match = CALENDAR_STATUS_RE.search(str(error))
+    return int(match.group(1)) if match else None
+
 def recover_from_calendar_error(operation_type, event_data, error):
     """Attempt to recover from calendar operation errors"""
     try:
         print(f"🔧 Attempting to recover from {operation_type} error: {error}")
         
-        if "401" in str(error):
-            # Authentication error
-            return False, "Authentication expired. Please re-authenticate with Google Calendar"
+        status = calendar_error_status(error)
+        if status in CALENDAR_ERROR_MESSAGES:
+            return False, CALENDAR_ERROR_MESSAGES[status]
             
-        elif "403" in str(error):
-            # Permission error
-            return False, "Permission denied. Check your Google Calendar permissions"
-            
-        elif "404" in str(error):
+        elif status == 404:
             if operation_type == 'delete':
                 # Event already deleted
                 print("ℹ️ Event already deleted, cleaning up session data")
@@ -1860,14 +2766,6 @@ def recover_from_calendar_error(operation_type, event_data, error):
             elif operation_type == 'update':
                 # Event doesn't exist anymore
                 return False, "Event no longer exists and cannot be updated"
-                
-        elif "429" in str(error):
-            # Rate limit
-            return False, "Rate limit exceeded. Please try again in a few moments"
-            
-        elif "503" in str(error) or "502" in str(error):
-            # Service temporarily unavailable
-            return False, "Google Calendar service temporarily unavailable. Please try again later"
             
         else:
             # Unknown error
@@ -1931,26 +2829,13 @@ def delete_event_with_sync(calendar_service, gmail_service, event_name):
         print(f"📋 Found event: {event_summary} (ID: {event_id})")
         print(f"👥 Attendees: {len(attendees)}")
         
-        # Send cancellation emails to attendees BEFORE deleting
+        # events().delete(sendUpdates='all') has Google email every attendee the cancellation
         user_email = get_authenticated_user_email()
-        notification_sent = False
-        
-        if attendees and user_email:
-            for attendee in attendees:
-                attendee_email = attendee.get('email')
-                if attendee_email and attendee_email.lower() != user_email.lower():
-                    print(f"📧 Sending cancellation email to: {attendee_email}")
-                    email_sent = send_meeting_cancellation_email(
-                        gmail_service,
-                        attendee_email,
-                        event_summary,
-                        "Meeting cancelled by organizer"
-                    )
-                    if email_sent:
-                        notification_sent = True
-                        print(f"✅ Cancellation email sent to {attendee_email}")
-                    else:
-                        print(f"⚠️ Failed to send cancellation email to {attendee_email}")
+        user_email_lower = user_email.lower() if user_email else None
+        notification_sent = any(
+            attendee.get('email') and attendee['email'].lower() != user_email_lower
+            for attendee in attendees
+        )
         
         # Delete the event from calendar with proper error handling
         try:
@@ -1959,35 +2844,19 @@ def delete_event_with_sync(calendar_service, gmail_service, event_name):
                 eventId=event_id,
                 sendUpdates='all'  # This ensures attendees get calendar cancellation notices
             ).execute()
+            invalidate_scheduled_meetings()
             
             print(f"✅ Event '{event_summary}' deleted successfully from calendar")
             
-            # Verify deletion by trying to fetch the event
-            try:
-                deleted_check = calendar_service.events().get(
-                    calendarId='primary',
-                    eventId=event_id
-                ).execute()
-                # If we can still get it, it might not be fully deleted
-                print(f"⚠️ Event still exists after deletion attempt: Status = {deleted_check.get('status', 'unknown')}")
-                if deleted_check.get('status') != 'cancelled':
-                    return False, "Event deletion may not have completed properly"
-            except Exception:
-                # This is expected - event should not be found after deletion
-                print(f"✅ Confirmed: Event no longer exists in calendar")
-            
             # Clean up session data
-            if 'scheduled_meetings' in session:
-                session['scheduled_meetings'] = [
-                    m for m in session['scheduled_meetings'] 
-                    if m.get('calendar_event_id') != event_id
-                ]
-                session.modified = True
+            stale_ids = [m['id'] for m in session_meetings_for_event(event_id)]
+            if stale_ids:
+                remove_session_meetings(stale_ids)
                 print("🧹 Session data cleaned up")
             
             success_message = f"Event '{event_summary}' deleted successfully"
             if notification_sent:
-                success_message += " and cancellation notifications sent to attendees"
+                success_message += " and attendees have been notified"
             
             return True, success_message
             
@@ -2009,10 +2878,54 @@ def delete_event_with_sync(calendar_service, gmail_service, event_name):
         print(f"❌ Unexpected error in delete_event_with_sync: {error}")
         return False, f"Unexpected error during deletion: {str(error)}"
 
+def find_attendee_conflicts(calendar_service, attendee_emails, start_time, end_time):
+    """Find which attendees already have an event in the window, with one Calendar request"""
+    # Every per-attendee check listed the same window, so list it once and match locally
+    try:
+        events_result = calendar_service.events().list(
+            calendarId='primary',
+            timeMin=start_time.isoformat(),
+            timeMax=end_time.isoformat(),
+            singleEvents=True,
+            orderBy='startTime',
+            fields='items(attendees/email)'
+        ).execute()
+    except Exception as e:
+        print(f"⚠️ Error checking calendar conflicts: {e}")
+        return set()
+    
+    wanted = {email.lower() for email in attendee_emails}
+    busy = set()
+    for event in events_result.get('items', []):
+        for attendee in event.get('attendees', []):
+            email = attendee.get('email', '').lower()
+            if email in wanted:
+                busy.add(email)
+    return busy
+
+def patch_event_if_unchanged(calendar_service, event, build_patch_body, **patch_args):
+    """Patch an event only if its ETag still matches, re-reading it once after a conflict"""
+    for attempt in range(2):
+        patch_request = calendar_service.events().patch(
+            calendarId='primary',
+            eventId=event['id'],
+            body=build_patch_body(event),
+            **patch_args
+        )
+        if event.get('etag'):
+            patch_request.headers['If-Match'] = event['etag']
+        try:
+            return patch_request.execute()
+        except Exception as error:
+            if attempt or calendar_error_status(error) != 412:
+                raise
+            update_logger.warning("⚠️ Event changed since it was read, retrying with the latest version")
+            event = calendar_service.events().get(calendarId='primary', eventId=event['id']).execute()
+
 def update_event_with_sync(calendar_service, gmail_service, event_name, new_date, new_time):
     """Enhanced update function with proper calendar synchronization"""
     try:
-        print(f"🔄 Starting update process for: {event_name}")
+        update_logger.info("🔄 Starting update process for: %s", event_name)
         
         # Find the event
         event = get_event_by_name(calendar_service, event_name)
@@ -2030,6 +2943,8 @@ def update_event_with_sync(calendar_service, gmail_service, event_name, new_date
             new_start_time, new_end_time = parse_datetime(new_date, new_time)
         except Exception as parse_error:
             return False, f"Invalid date/time format: {str(parse_error)}"
+        start_iso = new_start_time.isoformat()
+        end_iso = new_end_time.isoformat()
         
         # Store original details
         original_start = event.get('start', {})
@@ -2038,144 +2953,92 @@ def update_event_with_sync(calendar_service, gmail_service, event_name, new_date
         event_id = event['id']
         event_summary = event.get('summary', event_name)
         
-        print(f"📋 Found event: {event_summary} (ID: {event_id})")
-        print(f"⏰ Original time: {original_start.get('dateTime', 'unknown')} - {original_end.get('dateTime', 'unknown')}")
-        print(f"🔄 New time: {new_start_time.isoformat()} - {new_end_time.isoformat()}")
+        update_logger.info("📋 Found event: %s (ID: %s)", event_summary, event_id)
+        update_logger.info(
+            "⏰ Original time: %s - %s",
+            original_start.get('dateTime', 'unknown'),
+            original_end.get('dateTime', 'unknown')
+        )
+        update_logger.info("🔄 New time: %s - %s", start_iso, end_iso)
         
         # Check for conflicts with attendees
         user_email = get_authenticated_user_email()
         conflict_detected = False
+        attendee_emails = []
         
         if attendees and user_email:
-            for attendee in attendees:
-                attendee_email = attendee.get('email')
-                if attendee_email and attendee_email.lower() != user_email.lower():
-                    has_conflict = check_participant_calendar_conflicts(
-                        calendar_service,
+            user_email_lower = user_email.lower()
+            attendee_emails = [
+                attendee['email'] for attendee in attendees
+                if attendee.get('email') and attendee['email'].lower() != user_email_lower
+            ]
+        
+        if attendee_emails:
+            conflicted = find_attendee_conflicts(calendar_service, attendee_emails, new_start_time, new_end_time)
+            
+            for attendee_email in attendee_emails:
+                if attendee_email.lower() in conflicted:
+                    update_logger.warning("⚠️ Conflict detected for %s", attendee_email)
+                    queue_notification(
+                        f"conflict notice to {attendee_email}",
+                        send_conflict_notification,
+                        gmail_service,
                         attendee_email,
+                        event_summary,
                         new_start_time,
                         new_end_time
                     )
-                    if has_conflict:
-                        print(f"⚠️ Conflict detected for {attendee_email}")
-                        send_conflict_notification(
-                            gmail_service,
-                            attendee_email,
-                            event_summary,
-                            new_start_time,
-                            new_end_time
-                        )
-                        conflict_detected = True
+                    conflict_detected = True
         
         if conflict_detected:
             return False, "Scheduling conflicts detected. Participants have been notified."
         
-        # Send reschedule notification emails BEFORE updating
-        notification_sent = False
-        if attendees and user_email:
-            for attendee in attendees:
-                attendee_email = attendee.get('email')
-                if attendee_email and attendee_email.lower() != user_email.lower():
-                    print(f"📧 Sending reschedule notification to: {attendee_email}")
-                    
-                    # Format dates for email
-                    formatted_date = new_start_time.strftime('%A, %B %d, %Y')
-                    formatted_time = f"{new_start_time.strftime('%I:%M %p')} - {new_end_time.strftime('%I:%M %p')}"
-                    
-                    email_sent = send_enhanced_email(
-                        gmail_service,
-                        attendee_email,
-                        f"📅 Meeting Rescheduled: {event_summary}",
-                        f"""Hi,
-
-The meeting '{event_summary}' has been rescheduled.
-
-New Details:
-Date: {formatted_date}
-Time: {formatted_time}
-
-You will receive an updated calendar invitation shortly.
-
-Best regards""",
-                        f"""<html><body>
-                        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-                            <div style="background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%); color: white; padding: 30px; border-radius: 10px; text-align: center;">
-                                <h1 style="margin: 0; font-size: 28px;">📅 Meeting Rescheduled</h1>
-                            </div>
-                            <div style="background-color: #f0f9ff; padding: 25px; border-radius: 8px; margin: 25px 0; border-left: 5px solid #3b82f6;">
-                                <h2 style="color: #1d4ed8; margin: 10px 0;">{event_summary}</h2>
-                                <div style="background-color: #dbeafe; padding: 15px; border-radius: 6px; margin: 15px 0;">
-                                    <p style="margin: 0; color: #1e40af;"><strong>New Date:</strong> {formatted_date}</p>
-                                    <p style="margin: 0; color: #1e40af;"><strong>New Time:</strong> {formatted_time}</p>
-                                </div>
-                                <p style="color: #1e40af;">You will receive an updated calendar invitation shortly.</p>
-                            </div>
-                        </div>
-                        </body></html>"""
-                    )
-                    
-                    if email_sent:
-                        notification_sent = True
-                        print(f"✅ Reschedule notification sent to {attendee_email}")
-                    else:
-                        print(f"⚠️ Failed to send reschedule notification to {attendee_email}")
+        # events().patch(sendUpdates='all') has Google email every attendee the new time
+        notification_sent = bool(attendee_emails)
         
         # Update the calendar event
         try:
-            # Prepare the updated event data
-            updated_event = event.copy()  # Start with the existing event
-            
-            # Update the time fields
-            updated_event['start'] = {
-                'dateTime': new_start_time.isoformat(),
-                'timeZone': original_start.get('timeZone', 'UTC')
-            }
-            updated_event['end'] = {
-                'dateTime': new_end_time.isoformat(),
-                'timeZone': original_end.get('timeZone', 'UTC')
-            }
-            
             # Add/update description with update note
-            original_description = updated_event.get('description', '')
             update_note = f"\n\n[Updated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} via AI Calendar Assistant]"
-            updated_event['description'] = original_description + update_note
             
-            # Execute the update
-            result = calendar_service.events().update(
-                calendarId='primary',
-                eventId=event_id,
-                body=updated_event,
+            # Only the changed fields are sent; patch leaves the rest of the event as is
+            def build_patch_body(current_event):
+                return {
+                    'start': {
+                        'dateTime': start_iso,
+                        'timeZone': current_event.get('start', {}).get('timeZone', 'UTC')
+                    },
+                    'end': {
+                        'dateTime': end_iso,
+                        'timeZone': current_event.get('end', {}).get('timeZone', 'UTC')
+                    },
+                    'description': current_event.get('description', '') + update_note
+                }
+            
+            # Execute the update, failing instead of overwriting a concurrent edit
+            result = patch_event_if_unchanged(
+                calendar_service,
+                event,
+                build_patch_body,
                 sendUpdates='all'  # Send updates to all attendees
-            ).execute()
+            )
+            invalidate_scheduled_meetings()
             
-            print(f"✅ Event updated successfully in calendar")
-            print(f"🔗 Updated event link: {result.get('htmlLink', 'N/A')}")
+            update_logger.info("✅ Event updated successfully in calendar")
+            update_logger.info("🔗 Updated event link: %s", result.get('htmlLink', 'N/A'))
             
             # Update session data if exists
-            if 'scheduled_meetings' in session:
-                for meeting in session['scheduled_meetings']:
-                    if meeting.get('calendar_event_id') == event_id:
-                        meeting['event_date'] = new_date
-                        meeting['event_time'] = new_time
-                        break
-                session.modified = True
-                print("🧹 Session data updated")
-            
-            # Verify the update by fetching the updated event
-            try:
-                verification = calendar_service.events().get(
-                    calendarId='primary',
-                    eventId=event_id
-                ).execute()
-                
-                updated_start = verification.get('start', {}).get('dateTime', '')
-                if new_start_time.isoformat() in updated_start:
-                    print("✅ Update verified successfully")
-                else:
-                    print("⚠️ Update verification inconclusive")
-                    
-            except Exception as verify_error:
-                print(f"⚠️ Could not verify update: {verify_error}")
+            meeting = next(iter(session_meetings_for_event(event_id)), None)
+            if meeting:
+                update_session_meeting({**meeting, 'event_date': new_date, 'event_time': new_time})
+                update_logger.info("🧹 Session data updated")
+            
+            # Verify the update from the event returned by events().patch()
+            updated_start = result.get('start', {}).get('dateTime', '')
+            if start_iso in updated_start:
+                update_logger.info("✅ Update verified successfully")
+            else:
+                update_logger.warning("⚠️ Update verification inconclusive")
             
             success_message = f"Event '{event_summary}' updated successfully to {new_date} at {new_time}"
             if notification_sent:
@@ -2185,11 +3048,13 @@ Best regards""",
             
         except Exception as update_error:
             error_msg = str(update_error)
-            print(f"❌ Error updating event: {error_msg}")
+            update_logger.error("❌ Error updating event: %s", error_msg)
             
             # Handle specific errors
             if "404" in error_msg:
                 return False, f"Event '{event_name}' no longer exists"
+            elif "412" in error_msg:
+                return False, f"Event '{event_name}' is being changed elsewhere. Please try again"
             elif "403" in error_msg:
                 return False, "Permission denied. You may not have rights to update this event"
             elif "401" in error_msg:
@@ -2198,43 +3063,69 @@ Best regards""",
                 return False, f"Failed to update event: {error_msg}"
                 
     except Exception as error:
-        print(f"❌ Unexpected error in update_event_with_sync: {error}")
+        update_logger.error("❌ Unexpected error in update_event_with_sync: %s", error)
         return False, f"Unexpected error during update: {str(error)}"
 
-def verify_calendar_operation(calendar_service, event_id, operation_type):
-    """Verify that calendar operations completed successfully"""
-    try:
-        if operation_type == 'delete':
-            # For delete, we expect to NOT find the event
-            try:
-                event = calendar_service.events().get(
+def fetch_calendar_events_batch(calendar_service, event_ids):
+    """Fetch several calendar events in batched requests; missing events map to None"""
+    events = {}
+    
+    def on_event(request_id, response, exception):
+        if exception is None:
+            events[request_id] = response
+        elif calendar_error_status(exception) in (404, 410):
+            events[request_id] = None
+        else:
+            # Unknown failures are left out so callers do not treat the event as gone
+            print(f"⚠️ Error fetching calendar event {request_id}: {exception}")
+    
+    event_ids = list(dict.fromkeys(event_id for event_id in event_ids if event_id))
+    for start in range(0, len(event_ids), CALENDAR_BATCH_LIMIT):
+        batch = calendar_service.new_batch_http_request(callback=on_event)
+        for event_id in event_ids[start:start + CALENDAR_BATCH_LIMIT]:
+            batch.add(
+                calendar_service.events().get(
                     calendarId='primary',
-                    eventId=event_id
-                ).execute()
-                
-                # If we can still get it, check if it's cancelled
-                if event.get('status') == 'cancelled':
-                    return True, "Event successfully cancelled"
-                else:
-                    return False, "Event still active after deletion attempt"
-                    
-            except Exception:
-                # Event not found is expected for successful deletion
-                return True, "Event successfully deleted"
-                
-        elif operation_type == 'update':
-            # For update, verify the event still exists and has correct time
-            try:
-                event = calendar_service.events().get(
+                    eventId=event_id,
+                    fields='id,status,start,end'
+                ),
+                request_id=event_id
+            )
+        batch.execute()
+    
+    return events
+
+def delete_calendar_events_batch(calendar_service, event_ids):
+    """Delete several calendar events in batched requests, notifying attendees"""
+    results = {}
+    
+    def on_delete(request_id, response, exception):
+        if exception is None:
+            results[request_id] = (True, "Event successfully deleted")
+        elif calendar_error_status(exception) in (404, 410):
+            # Already gone counts as cancelled
+            results[request_id] = (True, "Event already deleted")
+        else:
+            print(f"⚠️ Error deleting calendar event {request_id}: {exception}")
+            results[request_id] = (False, str(exception))
+    
+    event_ids = list(dict.fromkeys(event_id for event_id in event_ids if event_id))
+    for start in range(0, len(event_ids), CALENDAR_BATCH_LIMIT):
+        batch = calendar_service.new_batch_http_request(callback=on_delete)
+        for event_id in event_ids[start:start + CALENDAR_BATCH_LIMIT]:
+            batch.add(
+                calendar_service.events().delete(
                     calendarId='primary',
-                    eventId=event_id
-                ).execute()
-                return True, "Event successfully updated"
-            except Exception:
-                return False, "Event not found after update"
-                
-    except Exception as error:
-        return False, f"Verification failed: {str(error)}"
+                    eventId=event_id,
+                    sendUpdates='all'
+                ),
+                request_id=event_id
+            )
+        batch.execute()
+    
+    if event_ids:
+        invalidate_scheduled_meetings()
+    return results
 
 def sync_session_with_calendar(calendar_service):
     """Synchronize session data with actual calendar state"""
@@ -2245,29 +3136,37 @@ def sync_session_with_calendar(calendar_service):
         calendar_meetings = get_scheduled_meetings_from_calendar()
         
         # Update session with fresh calendar data
-        if 'scheduled_meetings' in session:
+        session_meetings = load_session_meetings()
+        if session_meetings:
             # Remove any session meetings that no longer exist in calendar
-            session_meetings = session['scheduled_meetings']
-            valid_session_meetings = []
+            calendar_event_ids = {
+                cal_meeting['calendar_event_id'] for cal_meeting in calendar_meetings
+                if cal_meeting.get('calendar_event_id')
+            }
+            # Keep meetings without calendar IDs (might be recent additions)
+            candidates = [
+                session_meeting for session_meeting in session_meetings
+                if session_meeting.get('calendar_event_id')
+                and session_meeting['calendar_event_id'] not in calendar_event_ids
+            ]
             
-            for session_meeting in session_meetings:
-                calendar_event_id = session_meeting.get('calendar_event_id')
-                if calendar_event_id:
-                    # Check if this event still exists in calendar
-                    still_exists = any(
-                        cal_meeting.get('calendar_event_id') == calendar_event_id 
-                        for cal_meeting in calendar_meetings
-                    )
-                    if still_exists:
-                        valid_session_meetings.append(session_meeting)
-                    else:
+            # The listing only covers upcoming events, so confirm removals in batched gets
+            stale_ids = []
+            if candidates:
+                events = fetch_calendar_events_batch(
+                    calendar_service,
+                    [session_meeting['calendar_event_id'] for session_meeting in candidates]
+                )
+                for session_meeting in candidates:
+                    calendar_event_id = session_meeting['calendar_event_id']
+                    if calendar_event_id not in events:
+                        continue
+                    event = events[calendar_event_id]
+                    if event is None or event.get('status') == 'cancelled' or event_end_timestamp(event) <= time.time():
                         print(f"🧹 Removing stale session meeting: {session_meeting.get('event_name', 'Unknown')}")
-                else:
-                    # Keep meetings without calendar IDs (might be recent additions)
-                    valid_session_meetings.append(session_meeting)
+                        stale_ids.append(session_meeting['id'])
             
-            session['scheduled_meetings'] = valid_session_meetings
-            session.modified = True
+            remove_session_meetings(stale_ids)
             
         print(f"✅ Session sync completed. Found {len(calendar_meetings)} calendar events")
         return True
@@ -2305,9 +3204,7 @@ def delete_event_enhanced():
         )
         
         if success:
-            # Sync session data
-            sync_session_with_calendar(services['calendar'])
-            
+            # The *_with_sync helper already updated the session copy
             return jsonify({
                 'success': True,
                 'message': message,
@@ -2357,9 +3254,7 @@ def update_event_enhanced():
         )
         
         if success:
-            # Sync session data
-            sync_session_with_calendar(services['calendar'])
-            
+            # The *_with_sync helper already updated the session copy
             return jsonify({
                 'success': True,
                 'message': message,
@@ -2377,6 +3272,9 @@ def update_event_enhanced():
             'error': str(error)
         }), 500
 
+# Seconds clients may reuse an event search result; calendar changes here start a new ETag
+SEARCH_RESULTS_MAX_AGE = 30
+
 @app.route('/api/search_events', methods=['GET'])
 def search_events_api():
     """Search for events by name"""
@@ -2395,14 +3293,26 @@ def search_events_api():
                 'error': 'Calendar service not available'
             }), 500
         
-        # Search for events
-        suggestions = suggest_similar_events(services['calendar'], query)
-        
-        return jsonify({
-            'success': True,
-            'suggestions': suggestions,
-            'count': len(suggestions)
-        })
+        # Same query, same calendar state and same max-age window give the same result
+        etag = hashlib.sha1(
+            f"{get_authenticated_user_email()}:{query}:{calendar_meetings_generation}:"
+            f"{int(time.time() // SEARCH_RESULTS_MAX_AGE)}".encode('utf-8')
+        ).hexdigest()
+        if etag in request.if_none_match:
+            # A 304 must repeat the validator and caching headers of the full response
+            response = app.response_class(status=304)
+        else:
+            # Search for events
+            suggestions = suggest_similar_events(services['calendar'], query)
+            
+            response = jsonify({
+                'success': True,
+                'suggestions': suggestions,
+                'count': len(suggestions)
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = f'private, max-age={SEARCH_RESULTS_MAX_AGE}'
+        return response
         
     except Exception as error:
         return jsonify({
@@ -2459,7 +3369,7 @@ def validate_update_request(data):
     # Validate date format
     if data.get('new_date'):
         try:
-            parsed_date = dateparser.parse(data['new_date'])
+            parsed_date = parse_numeric_date(data['new_date'])
             if not parsed_date or parsed_date.date() < datetime.now().date():
                 errors.append("New date must be today or in the future")
         except:
@@ -2467,9 +3377,6 @@ def validate_update_request(data):
     
     return errors
 
-logging.basicConfig(level=logging.INFO)
-update_logger = logging.getLogger('calendar_updates')
-
 def log_update_attempt(event_name, user_input, success, message):
     """Log update attempts for debugging and monitoring"""
     log_entry = {
@@ -2521,10 +3428,165 @@ def test_update():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def process_meeting_request_email(email, conflict_cache=None):
+    """Extract, conflict-check and schedule one meeting request email off the request thread"""
+    meeting_details = extract_meeting_details_from_email(email)
+    if not meeting_details or not meeting_details.get('has_complete_info'):
+        return {'email': email, 'outcome': 'incomplete'}
+    
+    result = {'email': email, 'meeting_details': meeting_details}
+    try:
+        if not validate_email(meeting_details['participant_email']):
+            return {**result, 'outcome': 'invalid_email'}
+        
+        start_time, end_time = parse_datetime(
+            meeting_details['event_date'], 
+            meeting_details['event_time']
+        )
+        
+        # Requests in one batch share answers for the same participant and window. setdefault
+        # hands duplicates the same entry, and its lock makes their check-then-create atomic.
+        conflict_key = (meeting_details['participant_email'].lower(), start_time, end_time)
+        entry = None
+        if conflict_cache is not None:
+            entry = conflict_cache.setdefault(conflict_key, {'lock': threading.Lock(), 'has_conflict': None})
+        
+        event_created = None
+        with entry['lock'] if entry else nullcontext():
+            has_conflict = entry['has_conflict'] if entry else None
+            if has_conflict is None:
+                has_conflict = check_participant_calendar_conflicts(
+                    services['calendar'],
+                    meeting_details['participant_email'],
+                    start_time,
+                    end_time
+                )
+            if not has_conflict:
+                event_created, actual_meeting_link = create_event_with_meeting_link(
+                    services['calendar'],
+                    summary=meeting_details['event_name'],
+                    start_time=start_time,
+                    end_time=end_time,
+                    participant_email=meeting_details['participant_email']
+                )
+            if entry:
+                # A new event now occupies this participant's window
+                entry['has_conflict'] = bool(has_conflict or event_created)
+        
+        if has_conflict:
+            queue_notification(
+                f"conflict notice to {meeting_details['participant_email']}",
+                send_conflict_notification,
+                services['gmail'],
+                meeting_details['participant_email'],
+                meeting_details['event_name'],
+                start_time,
+                end_time
+            )
+            return {**result, 'outcome': 'conflict'}
+        
+        if not event_created:
+            return {**result, 'outcome': 'create_failed'}
+        return {
+            **result,
+            'outcome': 'scheduled',
+            'meeting_link': actual_meeting_link,
+            'calendar_event_id': event_created.get('id')
+        }
+        
+    except Exception as e:
+        return {**result, 'outcome': 'error', 'error': str(e)}
+
+def process_meeting_request_emails(meeting_requests):
+    """Process meeting request emails concurrently and track scheduled ones in the session"""
+    # Resolve the organizer email before workers need it for new events
+    get_authenticated_user_email()
+    
+    with ThreadPoolExecutor(max_workers=MEETING_REQUEST_MAX_WORKERS) as executor:
+        process_email = functools.partial(process_meeting_request_email, conflict_cache={})
+        results = list(executor.map(process_email, meeting_requests))
+    
+    # Session writes need the request context, so tracking stays on this thread
+    for result in results:
+        track_meeting_request_result(result)
+    
+    return results
+
+def track_meeting_request_result(result):
+    """Record a meeting scheduled from a request email in this session"""
+    if result['outcome'] == 'scheduled':
+        meeting_details = result['meeting_details']
+        track_scheduled_meeting(
+            meeting_details['participant_email'],
+            meeting_details['event_name'],
+            meeting_details['event_date'],
+            meeting_details['event_time'],
+            result['meeting_link'],
+            result['calendar_event_id']
+        )
+
+def meeting_request_status(result):
+    """Describe a processed meeting request email for the API response"""
+    subject = result['email']['subject']
+    outcome = result['outcome']
+    if outcome == 'scheduled':
+        return {
+            'email_subject': subject,
+            'event_name': result['meeting_details']['event_name'],
+            'status': 'scheduled successfully',
+            'meeting_link': result['meeting_link']
+        }
+    elif outcome == 'conflict':
+        return {
+            'email_subject': subject,
+            'event_name': result['meeting_details']['event_name'],
+            'status': 'conflict: participant has another meeting'
+        }
+    elif outcome == 'invalid_email':
+        return {
+            'email_subject': subject,
+            'status': 'error: invalid participant email'
+        }
+    elif outcome == 'create_failed':
+        return {
+            'email_subject': subject,
+            'status': 'error: failed to create calendar event'
+        }
+    elif outcome == 'error':
+        return {
+            'email_subject': subject,
+            'status': f"error: {result['error']}"
+        }
+    return {
+        'email_subject': subject,
+        'status': 'incomplete_info'
+    }
+
+def stream_processed_meetings(meeting_requests):
+    """Yield the process_meeting_requests JSON body as each email finishes"""
+    # Resolve the organizer email before workers need it for new events
+    get_authenticated_user_email()
+    
+    yield b'{"success":true,"processed_meetings":['
+    conflict_cache = {}
+    with ThreadPoolExecutor(max_workers=MEETING_REQUEST_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(process_meeting_request_email, email, conflict_cache): email
+            for email in meeting_requests
+        }
+        for index, future in enumerate(as_completed(futures)):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'email': futures[future], 'outcome': 'error', 'error': str(e)}
+            track_meeting_request_result(result)
+            yield (b',' if index else b'') + app.json.dumps_bytes(meeting_request_status(result))
+    yield b'],"total_scheduled_meetings":' + app.json.dumps_bytes(get_scheduled_meetings_count()) + b'}'
+
 def process_meeting_requests_from_chat():
     """Process meeting requests from chat flow"""
     try:
-        meeting_requests = session.get('meeting_requests', [])
+        meeting_requests = load_session_list('meeting_requests')
         
         if not meeting_requests:
             return jsonify({'reply': 'No meeting requests found to process.'})
@@ -2536,61 +3598,21 @@ def process_meeting_requests_from_chat():
         conflicts_count = 0
         errors = []
         
-        for email in meeting_requests[:3]:  # Process first 3
-            meeting_details = extract_meeting_details_from_email(email)
-            if meeting_details and meeting_details.get('has_complete_info'):
-                try:
-                    if not validate_email(meeting_details['participant_email']):
-                        errors.append(f"Error processing {email.get('subject', 'Unknown')}: Invalid participant email.")
-                        continue
-                    
-                    start_time, end_time = parse_datetime(
-                        meeting_details['event_date'], 
-                        meeting_details['event_time']
-                    )
-                    
-                    has_conflict = check_participant_calendar_conflicts(
-                        services['calendar'],
-                        meeting_details['participant_email'],
-                        start_time,
-                        end_time
-                    )
-                    
-                    if has_conflict:
-                        send_conflict_notification(
-                            services['gmail'],
-                            meeting_details['participant_email'],
-                            meeting_details['event_name'],
-                            start_time,
-                            end_time
-                        )
-                        conflicts_count += 1
-                    else:
-                        event_created, actual_meeting_link = create_event_with_meeting_link(
-                            services['calendar'],
-                            summary=meeting_details['event_name'],
-                            start_time=start_time,
-                            end_time=end_time,
-                            participant_email=meeting_details['participant_email']
-                        )
-                        
-                        if event_created:
-                            track_scheduled_meeting(
-                                meeting_details['participant_email'],
-                                meeting_details['event_name'],
-                                meeting_details['event_date'],
-                                meeting_details['event_time'],
-                                actual_meeting_link,
-                                event_created.get('id')
-                            )
-                            processed_count += 1
-                        else:
-                            errors.append(f"Error processing {email.get('subject', 'Unknown')}: Failed to create calendar event.")
-                            
-                except Exception as e:
-                    errors.append(f"Error processing {email.get('subject', 'Unknown')}: {str(e)}")
+        for result in process_meeting_request_emails(meeting_requests[:3]):  # Process first 3
+            subject = result['email'].get('subject', 'Unknown')
+            outcome = result['outcome']
+            if outcome == 'scheduled':
+                processed_count += 1
+            elif outcome == 'conflict':
+                conflicts_count += 1
+            elif outcome == 'invalid_email':
+                errors.append(f"Error processing {subject}: Invalid participant email.")
+            elif outcome == 'create_failed':
+                errors.append(f"Error processing {subject}: Failed to create calendar event.")
+            elif outcome == 'error':
+                errors.append(f"Error processing {subject}: {result['error']}")
             else:
-                errors.append(f"Skipping {email.get('subject', 'Unknown')}: Incomplete meeting details extracted.")
+                errors.append(f"Skipping {subject}: Incomplete meeting details extracted.")
         
         response_msg = f"✅ Processed {processed_count} meeting requests successfully!"
         if conflicts_count > 0:
@@ -2612,7 +3634,7 @@ def process_meeting_requests_from_chat():
 def process_meeting_requests():
     """Process meeting requests automatically with enhanced email notifications"""
     try:
-        meeting_requests = session.get('meeting_requests', [])
+        meeting_requests = load_session_list('meeting_requests')
         
         if not meeting_requests:
             return jsonify({
@@ -2626,92 +3648,23 @@ def process_meeting_requests():
                 'error': 'Services not available'
             }), 500
         
-        processed_meetings = []
-        
-        for email in meeting_requests:
-            meeting_details = extract_meeting_details_from_email(email)
-            
-            if meeting_details and meeting_details.get('has_complete_info'):
-                try:
-                    if not validate_email(meeting_details['participant_email']):
-                        processed_meetings.append({
-                            'email_subject': email['subject'],
-                            'status': 'error: invalid participant email'
-                        })
-                        continue
-                    
-                    start_time, end_time = parse_datetime(
-                        meeting_details['event_date'], 
-                        meeting_details['event_time']
-                    )
-                    
-                    has_conflict = check_participant_calendar_conflicts(
-                        services['calendar'],
-                        meeting_details['participant_email'],
-                        start_time,
-                        end_time
-                    )
-                    
-                    if has_conflict:
-                        send_conflict_notification(
-                            services['gmail'],
-                            meeting_details['participant_email'],
-                            meeting_details['event_name'],
-                            start_time,
-                            end_time
-                        )
-                        processed_meetings.append({
-                            'email_subject': email['subject'],
-                            'event_name': meeting_details['event_name'],
-                            'status': 'conflict: participant has another meeting'
-                        })
-                    else:
-                        event_created, actual_meeting_link = create_event_with_meeting_link(
-                            services['calendar'],
-                            summary=meeting_details['event_name'],
-                            start_time=start_time,
-                            end_time=end_time,
-                            participant_email=meeting_details['participant_email']
-                        )
-                        
-                        if event_created:
-                            track_scheduled_meeting(
-                                meeting_details['participant_email'],
-                                meeting_details['event_name'],
-                                meeting_details['event_date'],
-                                meeting_details['event_time'],
-                                actual_meeting_link,
-                                event_created.get('id')
-                            )
-                            
-                            processed_meetings.append({
-                                'email_subject': email['subject'],
-                                'event_name': meeting_details['event_name'],
-                                'status': 'scheduled successfully',
-                                'meeting_link': actual_meeting_link
-                            })
-                        else:
-                            processed_meetings.append({
-                                'email_subject': email['subject'],
-                                'status': 'error: failed to create calendar event'
-                            })
-                            
-                except Exception as e:
-                    processed_meetings.append({
-                        'email_subject': email['subject'],
-                        'status': f'error: {str(e)}'
-                    })
-            else:
-                processed_meetings.append({
-                    'email_subject': email['subject'],
-                    'status': 'incomplete_info'
-                })
+        if meeting_store is None:
+            # Meetings live in the session itself, which is saved before a streamed body
+            return jsonify({
+                'success': True,
+                'processed_meetings': [
+                    meeting_request_status(result)
+                    for result in process_meeting_request_emails(meeting_requests)
+                ],
+                'total_scheduled_meetings': get_scheduled_meetings_count()
+            })
         
-        return jsonify({
-            'success': True,
-            'processed_meetings': processed_meetings,
-            'total_scheduled_meetings': get_scheduled_meetings_count()
-        })
+        # The session is saved with the headers, so create the meetings key up front
+        session_meetings_key(create=True)
+        return app.response_class(
+            stream_with_context(stream_processed_meetings(meeting_requests)),
+            mimetype='application/json'
+        )
         
     except Exception as error:
         return jsonify({
@@ -2722,8 +3675,7 @@ def process_meeting_requests():
 @app.route('/api/email/<email_id>')
 def get_email_details(email_id):
     """Get detailed view of specific email"""
-    processed_emails = session.get('processed_emails', [])
-    email = next((e for e in processed_emails if e['id'] == email_id), None)
+    email = find_session_list_item('processed_emails', email_id)
     
     if email:
         return jsonify({'success': True, 'email': email})
@@ -2763,6 +3715,7 @@ def test_email_sending():
 def clear_session():
     """Clear session data"""
     session.clear()
+    clear_ai_cache('extract_meeting')
     return jsonify({'success': True})
 
 @app.route('/api/send_custom_email', methods=['POST'])
@@ -2786,23 +3739,7 @@ def send_custom_email():
             recipient,
             subject,
             message,
-            f"""
-            <html>
-            <body>
-                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                    <h2 style="color: #2563eb;">{subject}</h2>
-                    <div style="background-color: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                        {message.replace('\n', '<br>')}
-                    </div>
-                    <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb;">
-                        <p style="color: #6b7280; font-size: 14px;">
-                            This message was sent by the AI Calendar Management System.
-                        </p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            CUSTOM_EMAIL_HTML_TEMPLATE.render(subject=subject, message=message)
         )
         
         if success:
@@ -2820,13 +3757,10 @@ def refresh_calendar():
         if not services or 'calendar' not in services:
             return jsonify({'success': False, 'error': 'Calendar service not available'})
         
-        # Get fresh calendar data
+        # Get fresh calendar data; an explicit refresh bypasses the cached listing
+        invalidate_scheduled_meetings()
         calendar_meetings = get_scheduled_meetings_from_calendar()
         
-        # Update session with fresh calendar data
-        session['calendar_meetings'] = calendar_meetings
-        session.modified = True
-        
         # Get combined meetings count
         total_meetings = get_scheduled_meetings_count()
         
@@ -2844,32 +3778,25 @@ def refresh_calendar():
 def get_system_stats():
     """Get system statistics"""
     try:
-        # Get email stats
-        processed_emails = session.get('processed_emails', [])
-        meeting_requests = session.get('meeting_requests', [])
+        # Get email stats (counted when the emails were processed)
+        email_stats = load_email_stats()
         
         # Get calendar stats
-        scheduled_meetings = get_all_scheduled_meetings()
-        
-        # Calculate stats
-        total_emails = len(processed_emails)
-        high_priority_emails = len([e for e in processed_emails if e.get('ai_urgency') == 'high'])
-        action_required_emails = len([e for e in processed_emails if e.get('action_required')])
-        meeting_request_emails = len([e for e in processed_emails if e.get('is_meeting_request', False)])
+        total_scheduled, from_calendar, from_session = get_scheduled_meeting_counts()
         
         stats = {
             'emails': {
-                'total': total_emails,
-                'high_priority': high_priority_emails,
-                'action_required': action_required_emails,
-                'meeting_requests': meeting_request_emails,
+                'total': email_stats['total'],
+                'high_priority': email_stats['high_priority'],
+                'action_required': email_stats['action_required'],
+                'meeting_requests': email_stats['meeting_requests'],
                 'last_fetch': session.get('last_email_fetch', 'Never')
             },
             'meetings': {
-                'total_scheduled': len(scheduled_meetings),
-                'from_calendar': len([m for m in scheduled_meetings if m.get('id', '').startswith('cal_')]),
-                'from_session': len([m for m in scheduled_meetings if not m.get('id', '').startswith('cal_')]),
-                'pending_requests': len(meeting_requests)
+                'total_scheduled': total_scheduled,
+                'from_calendar': from_calendar,
+                'from_session': from_session,
+                'pending_requests': email_stats['pending_requests']
             },
             'system': {
                 'ai_model_available': model is not None,
@@ -2892,39 +3819,29 @@ def cancel_meeting(meeting_id):
     """Cancel a specific meeting"""
     try:
         # Get meeting details
-        all_meetings = get_all_scheduled_meetings()
-        meeting = next((m for m in all_meetings if m['id'] == meeting_id), None)
+        meeting = get_scheduled_meeting(meeting_id)
         
         if not meeting:
             return jsonify({'success': False, 'error': 'Meeting not found'})
         
-        if not services or 'calendar' not in services or 'gmail' not in services:
+        if not services or 'calendar' not in services:
             return jsonify({'success': False, 'error': 'Services not available'})
         
-        # Send cancellation email
-        if meeting.get('participant_email'):
-            send_meeting_cancellation_email(
-                services['gmail'],
-                meeting['participant_email'],
-                meeting['event_name'],
-                "Meeting cancelled via AI Calendar System"
-            )
-        
-        # Delete from calendar if it has a calendar event ID
+        # Delete from calendar if it has a calendar event ID; sendUpdates='all' notifies the participants
         if meeting.get('calendar_event_id'):
             try:
                 services['calendar'].events().delete(
                     calendarId='primary',
-                    eventId=meeting['calendar_event_id']
+                    eventId=meeting['calendar_event_id'],
+                    sendUpdates='all'
                 ).execute()
+                invalidate_scheduled_meetings()
                 print(f"✅ Deleted calendar event: {meeting['calendar_event_id']}")
             except Exception as e:
                 print(f"⚠️ Error deleting calendar event: {e}")
         
         # Remove from session if it exists there
-        session_meetings = session.get('scheduled_meetings', [])
-        session['scheduled_meetings'] = [m for m in session_meetings if m['id'] != meeting_id]
-        session.modified = True
+        remove_session_meetings([meeting_id])
         
         return jsonify({
             'success': True,
@@ -2940,35 +3857,28 @@ def handle_input():
     field = request.json.get("field", "")
     data = session.get("data", {})
 
+    value = user_input.strip()
     if field == "email":
-        if validate_email(user_input.strip()):
-            email = user_input.strip()
-            data[field] = email
-            session['data'] = data
-            session.pop('waiting_for', None)
-            session.modified = True
-            print(f"DEBUG - Email validated and stored: {email}")
-            return jsonify({"reply": "✅ Email saved successfully!"})
-        else:
+        if not validate_email(value):
             return jsonify({
                 "reply": "⚠️ Please enter a valid email address (e.g., user@example.com)."
             })
-
+        reply = "✅ Email saved successfully!"
     elif field == "event_name":
-        event_name = user_input.strip()
-        if event_name:
-            data[field] = event_name
-            session['data'] = data
-            session.pop('waiting_for', None)
-            session.modified = True
-            print(f"DEBUG - Event name stored: {event_name}")
-            return jsonify({"reply": "✅ Event name saved successfully!"})
-        else:
+        if not value:
             return jsonify({
                 "reply": "⚠️ Please enter a valid event name."
             })
+        reply = "✅ Event name saved successfully!"
+    else:
+        return jsonify({"reply": "⚠️ Unknown field."})
 
-    return jsonify({"reply": "⚠️ Unknown field."})
+    # Assigning already marks the session dirty; it is written once when the response is sent
+    data[field] = value
+    session['data'] = data
+    session.pop('waiting_for', None)
+    logger.debug("Field %s stored: %s", field, value)
+    return jsonify({"reply": reply})
 
 # Add these routes for complete clickable functionality
 
@@ -2976,7 +3886,7 @@ def handle_input():
 def get_emails_by_category(category):
     """Handle clicks on email category summaries"""
     try:
-        processed_emails = session.get('processed_emails', [])
+        processed_emails = load_session_list('processed_emails')
         
         if category == 'total':
             emails = processed_emails
@@ -3009,8 +3919,7 @@ def get_emails_by_category(category):
 def get_meeting_details(meeting_id):
     """Handle clicks on individual meeting requests"""
     try:
-        meeting_requests = session.get('meeting_requests', [])
-        meeting = next((m for m in meeting_requests if m.get('id') == meeting_id), None)
+        meeting = find_session_list_item('meeting_requests', meeting_id)
         
         if not meeting:
             return jsonify({"error": "Meeting not found"}), 404
@@ -3059,5 +3968,5 @@ if __name__ == '__main__':
     print("✅ UPDATE FUNCTIONALITY FIXED - Proper field mapping and flow")
     print("🔧 Enhanced error handling and validation")
 
-    # Run your FastAPI/Flask app depending on framework
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(debug=os.getenv("FLASK_DEBUG", "1") == "1", host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
@@ -3,6 +3,7 @@ import re
 import time
 import json
 import pickle
+import functools
 import dateparser
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
@@ -32,6 +33,10 @@ chat = model.start_chat()
 # Global services variable
 services = None
 
+# Bound on memoized results for the pure chat-input helpers below
+INPUT_CACHE_SIZE = 2048
+
+@functools.lru_cache(maxsize=INPUT_CACHE_SIZE)
 def correct_schedule_spelling(text):
     """Correct common spelling mistakes in scheduling text"""
     corrections = {
@@ -49,11 +54,13 @@ def correct_schedule_spelling(text):
     
     return text
 
+@functools.lru_cache(maxsize=INPUT_CACHE_SIZE)
 def is_schedule_intent(message):
     """Check if message contains scheduling intent"""
     schedule_keywords = ['schedule', 'meet', 'meeting', 'appointment', 'book', 'plan']
     return any(keyword in message.lower() for keyword in schedule_keywords)
 
+@functools.lru_cache(maxsize=INPUT_CACHE_SIZE)
 def is_update_intent(message):
     """Check if message contains update intent"""
     update_keywords = [
@@ -62,6 +69,7 @@ def is_update_intent(message):
     ]
     return any(keyword in message.lower() for keyword in update_keywords)
 
+@functools.lru_cache(maxsize=INPUT_CACHE_SIZE)
 def is_delete_intent(message):
     """Check if message contains delete intent"""
     delete_keywords = ['delete', 'cancel', 'remove']
@@ -1716,10 +1724,11 @@ def send_invitation(gmail_service, participant_email, event_date, event_time, ev
         print(f"Error sending invitation: {e}")
         return time.time(), False
 
+VALID_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 def validate_email_format(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return VALID_EMAIL_RE.fullmatch(email) is not None
 
 def process_natural_language_time(time_text):
     """Process natural language time expressions"""
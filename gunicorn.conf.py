@@ -0,0 +1,16 @@
+# Production server settings: gunicorn -c gunicorn.conf.py app:app
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Threaded workers: requests spend most of their time waiting on Gmail/Calendar/Gemini,
+# and the app already relies on real threads (executors, locks, the log listener).
+# One process, because the calendar caches, their invalidation and the search ETag
+# generation live in process memory; extra workers would serve each other's stale data.
+worker_class = "gthread"
+workers = 1
+threads = int(os.getenv("GUNICORN_THREADS", 16))
+
+# Email processing fans out to Gemini and can take a while on large batches
+timeout = 120
+keepalive = 5
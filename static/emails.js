@@ -13,7 +13,7 @@ async function loadEmails() {
     loading.classList.remove('hidden');
     
     try {
-        const response = await fetch('/api/emails');
+        const response = await fetch('/api/emails?fields=preview');
         const data = await response.json();
         
         if (data.success) {